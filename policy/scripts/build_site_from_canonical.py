@@ -6,14 +6,19 @@ import os
 from pathlib import Path
 
 from runtime_guard import enforce_venv
-from pipeline_lib import ROOT, build_manifest, generate_site, read_json, validate_schema, write_json
+from pipeline_lib import ROOT, build_manifest, generate_site, iter_json_array, validate_schema, write_json
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Build static site from canonical dataset")
     parser.add_argument("--run-id", required=True)
-    parser.add_argument("--canonical", default="data/canonical/latest/policies.json")
+    parser.add_argument(
+        "--canonical",
+        default="data/canonical/latest/policies.json",
+        help="Canonical JSON array (.json or .json.gz)",
+    )
     parser.add_argument("--site-base-url", default=os.getenv("SITE_BASE_URL", "https://pol.cbbxs.com"))
+    parser.add_argument("--full-rebuild", action="store_true", help="Ignore the site build cache and render every page")
     return parser.parse_args()
 
 
@@ -25,15 +30,25 @@ def main() -> int:
         print(f"[ERROR] canonical not found: {canonical_path}")
         return 1
 
-    canonical = read_json(canonical_path)
-    if not isinstance(canonical, list):
+    # Records are streamed; generate_site keeps only the active ones.
+    try:
+        canonical = iter_json_array(canonical_path)
+    except ValueError:
         print("[ERROR] canonical must be list")
         return 1
 
     site_dir = ROOT / "apps" / "site" / "dist"
     adsense_client_id = os.getenv("ADSENSE_CLIENT_ID", "")
     ga_measurement_id = os.getenv("GA_MEASUREMENT_ID", "")
-    site_result = generate_site(canonical, [], site_dir, args.site_base_url, adsense_client_id, ga_measurement_id)
+    site_result = generate_site(
+        canonical,
+        [],
+        site_dir,
+        args.site_base_url,
+        adsense_client_id,
+        ga_measurement_id,
+        full_rebuild=args.full_rebuild,
+    )
 
     manifest = build_manifest(
         run_id=args.run_id,
@@ -42,6 +57,7 @@ def main() -> int:
         sitemap_entries=site_result["sitemap_entries"],
     )
     manifest["generated_thumbnails"] = int(site_result.get("generated_thumbnails", 0))
+    manifest["reused_thumbnails"] = int(site_result.get("reused_thumbnails", 0))
     schema_errors = validate_schema(manifest, ROOT / "schemas" / "manifest.v1.schema.json")
     if schema_errors:
         print(f"[ERROR] manifest invalid: {schema_errors[:5]}")
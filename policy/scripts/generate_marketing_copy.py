@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import heapq
 import re
 from typing import Any
 
 from runtime_guard import enforce_venv
-from pipeline_lib import ROOT, now_iso, read_json, write_json
+from pipeline_lib import ROOT, now_iso, read_json_large, write_json
 
 
 AMOUNT_PATTERNS = [
@@ -15,6 +16,12 @@ AMOUNT_PATTERNS = [
     re.compile(r"(\d[\d,]*(?:\.\d+)?\s*(?:원|천원|만원|억 원|억원))"),
     re.compile(r"(\d[\d,]*(?:\.\d+)?\s*%)"),
 ]
+_WS_RE = re.compile(r"\s+")
+_DIGITS8_RE = re.compile(r"\d{8}")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_YEAR_PREFIX_RE = re.compile(r"^\d{4}년\s*")
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_TARGET_SPLIT_RE = re.compile(r"[,/·ㆍ|]")
 
 
 def parse_args() -> argparse.Namespace:
@@ -32,12 +39,12 @@ def parse_args() -> argparse.Namespace:
 
 def clean_text(value: Any) -> str:
     text = str(value or "").replace("\r", " ").replace("\n", " ")
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
 def parse_yyyymmdd(value: str) -> dt.date | None:
-    digits = "".join(ch for ch in clean_text(value) if ch.isdigit())
+    digits = "".join(filter(str.isdigit, clean_text(value)))
     if len(digits) < 8:
         return None
     text = digits[:8]
@@ -55,7 +62,7 @@ def format_date_yyyy_mm_dd(value: str) -> str:
 
 
 def parse_period(period_text: str) -> tuple[dt.date | None, dt.date | None]:
-    tokens = re.findall(r"\d{8}", clean_text(period_text))
+    tokens = _DIGITS8_RE.findall(clean_text(period_text))
     if not tokens:
         return None, None
     if len(tokens) == 1:
@@ -76,7 +83,7 @@ def first_sentence(text: str) -> str:
     if not text:
         return ""
     # Prefer first complete sentence; fallback to first 120 chars.
-    parts = re.split(r"(?<=[.!?])\s+", text)
+    parts = _SENT_SPLIT_RE.split(text)
     picked = parts[0].strip() if parts else ""
     if not picked:
         return text[:120].strip()
@@ -87,8 +94,8 @@ def first_sentence(text: str) -> str:
 
 def compact_title(title: str) -> str:
     text = clean_text(title)
-    text = re.sub(r"^\d{4}년\s*", "", text)
-    text = re.sub(r"\s{2,}", " ", text)
+    text = _YEAR_PREFIX_RE.sub("", text)
+    text = _MULTISPACE_RE.sub(" ", text)
     return text
 
 
@@ -99,43 +106,47 @@ def shorten(text: str, limit: int) -> str:
     return value[: max(limit - 1, 0)].rstrip() + "…"
 
 
-def extract_amount_hook(*texts: str) -> str:
-    for text in texts:
-        candidate = clean_text(text)
+def find_amount_hook(*cleaned_texts: str) -> str:
+    # Inputs are already clean_text()-ed, so matches need no further cleanup.
+    for candidate in cleaned_texts:
         if not candidate:
             continue
         for pattern in AMOUNT_PATTERNS:
             match = pattern.search(candidate)
             if match:
-                return clean_text(match.group(1))
+                return match.group(1)
     return ""
 
 
-def sort_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    def date_score(row: dict[str, Any]) -> int:
-        digits = "".join(ch for ch in clean_text(row.get("source_updated_at", "")) if ch.isdigit())
-        if len(digits) >= 8:
-            return int(digits[:8])
-        return 0
+def date_score(row: dict[str, Any]) -> int:
+    digits = "".join(filter(str.isdigit, clean_text(row.get("source_updated_at", ""))))
+    if len(digits) >= 8:
+        return int(digits[:8])
+    return 0
+
+
+def info_score(row: dict[str, Any]) -> int:
+    return len(clean_text(row.get("benefit_text"))) + len(clean_text(row.get("eligibility_text")))
 
-    def info_score(row: dict[str, Any]) -> int:
-        return len(clean_text(row.get("benefit_text"))) + len(clean_text(row.get("eligibility_text")))
 
-    return sorted(
-        rows,
-        key=lambda row: (
-            clean_text(row.get("status")).lower() != "active",
-            -date_score(row),
-            -info_score(row),
-        ),
+def row_sort_key(row: dict[str, Any]) -> tuple[bool, int, int]:
+    return (
+        clean_text(row.get("status")).lower() != "active",
+        -date_score(row),
+        -info_score(row),
     )
 
 
+def sort_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # sorted() evaluates the key once per row and sorts on the cached tuples.
+    return sorted(rows, key=row_sort_key)
+
+
 def primary_target(target_text: str) -> str:
     cleaned = clean_text(target_text)
     if not cleaned:
         return "신청자"
-    for token in re.split(r"[,/·ㆍ|]", cleaned):
+    for token in _TARGET_SPLIT_RE.split(cleaned):
         part = token.strip()
         if part:
             return part
@@ -163,7 +174,7 @@ def resolve_deadline_hook(period_text: str, status: str, today: dt.date) -> tupl
 def pick_template_index(policy_id: str, size: int) -> int:
     if size <= 0:
         return 0
-    digits = "".join(ch for ch in policy_id if ch.isdigit())
+    digits = "".join(filter(str.isdigit, policy_id))
     if digits:
         return int(digits) % size
     return len(policy_id) % size
@@ -172,7 +183,8 @@ def pick_template_index(policy_id: str, size: int) -> int:
 def build_copy(row: dict[str, Any], style: str) -> dict[str, Any]:
     title = clean_text(row.get("title")) or "지원사업 공고"
     short_title = compact_title(title)
-    benefit = clean_text(row.get("benefit_text")) or "지원 내용은 공고문 참고"
+    benefit_text = clean_text(row.get("benefit_text"))
+    benefit = benefit_text or "지원 내용은 공고문 참고"
     target = clean_text(row.get("target_group")) or "공고문 참고"
     period_raw = clean_text(row.get("application_period_text")) or "공고문 참고"
     period = format_period(period_raw)
@@ -182,11 +194,7 @@ def build_copy(row: dict[str, Any], style: str) -> dict[str, Any]:
     target_one = primary_target(target)
     today = dt.date.today()
 
-    amount_hook = extract_amount_hook(
-        clean_text(row.get("benefit_text")),
-        clean_text(row.get("eligibility_text")),
-        title,
-    )
+    amount_hook = find_amount_hook(benefit_text, clean_text(row.get("eligibility_text")), title)
     deadline_hook, days_left = resolve_deadline_hook(period_raw, status, today)
 
     templates = [
@@ -238,11 +246,12 @@ def main() -> int:
     input_path = ROOT / args.input
     output_path = ROOT / args.output
 
-    rows = read_json(input_path)
+    rows = read_json_large(input_path)
     if not isinstance(rows, list):
         raise RuntimeError("input canonical must be a list")
 
-    selected = sort_rows([row for row in rows if isinstance(row, dict)])[: max(args.top_n, 0)]
+    # Same order as sort_rows(...)[:top_n], but keeps only top_n rows in a heap instead of sorting them all.
+    selected = heapq.nsmallest(max(args.top_n, 0), (row for row in rows if isinstance(row, dict)), key=row_sort_key)
     copies = [build_copy(row, args.style) for row in selected]
 
     result = {
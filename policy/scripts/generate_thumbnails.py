@@ -2,38 +2,48 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 
+from pipeline_lib import ensure_dir, read_json, write_bytes_if_changed, write_json
+
 
 ROOT = Path(__file__).resolve().parents[1]
 SIZE = (1200, 675)
 
+NAVY = (13, 49, 146)
+BLUE = (41, 101, 241)
+SKY = (85, 186, 255)
+TOP_BG = (248, 246, 238)
+INK = (18, 24, 39)
+OFF_WHITE = (246, 250, 255)
+BADGE_ORANGE = (255, 116, 39)
+PILL_BG = (224, 236, 255)
+ARROW_OUTER_RADIUS = 108
+JPEG_QUALITY = 88
 
-def ensure_dir(path: Path) -> None:
-    path.mkdir(parents=True, exist_ok=True)
-
-
-def read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_SPACE = re.compile(r"[\s_]+")
+_SLUG_DASH = re.compile(r"-+")
+_DELIM_TABLE = str.maketrans({"，": ",", "ㆍ": ",", "·": ",", "/": ",", "|": ","})
+_AMOUNT_RE = re.compile(r"([0-9][0-9,\.]*(?:\s*)(?:만원|원|억원|천원|백만원|%))")
 
-
-def write_json(path: Path, data: Any) -> None:
-    ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+# Policy-invariant backgrounds keyed by (path, size); filled once per worker process.
+_BACKGROUND_CACHE: dict[tuple[str, tuple[int, int]], Image.Image] = {}
 
 
 def slugify(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^\w\s-]", "", value)
-    value = re.sub(r"[\s_]+", "-", value)
-    value = re.sub(r"-+", "-", value).strip("-")
+    value = _SLUG_NONWORD.sub("", value)
+    value = _SLUG_SPACE.sub("-", value)
+    value = _SLUG_DASH.sub("-", value).strip("-")
     return value or "unknown"
 
 
@@ -41,14 +51,64 @@ def fit_cover(image: Image.Image, size: tuple[int, int]) -> Image.Image:
     return ImageOps.fit(image, size, method=Image.Resampling.LANCZOS, centering=(0.5, 0.5))
 
 
+def top_split_y(size: tuple[int, int]) -> int:
+    return int(size[1] * 0.48)
+
+
+def tint_table(color: tuple[int, int, int], alpha: float) -> list[int]:
+    # Same arithmetic as Image.blend against a solid color, as a per-band lookup table.
+    table: list[int] = []
+    for channel in color:
+        table.extend(min(255, max(0, int(v + alpha * (channel - v)))) for v in range(256))
+    return table
+
+
+def build_background(base_image_path: Path, size: tuple[int, int] = SIZE) -> Image.Image:
+    with Image.open(base_image_path) as base_image:
+        fitted = fit_cover(base_image.convert("RGB"), size)
+    canvas = fitted.point(tint_table(NAVY, 0.84))
+    draw = ImageDraw.Draw(canvas)
+
+    top_split = top_split_y(size)
+    draw.rectangle((6, 6, size[0] - 6, top_split), fill=TOP_BG)
+    draw.rectangle((0, top_split + 1, size[0], size[1]), fill=BLUE)
+    draw.rounded_rectangle((42, 26, 58, 178), radius=8, fill=SKY)
+    for i in range(4):
+        draw.rectangle((i, i, size[0] - 1 - i, size[1] - 1 - i), outline=NAVY, width=1)
+    return canvas
+
+
+def load_background(base_image_path: Path, size: tuple[int, int] = SIZE) -> Image.Image:
+    key = (str(base_image_path), size)
+    background = _BACKGROUND_CACHE.get(key)
+    if background is None:
+        background = build_background(base_image_path, size)
+        _BACKGROUND_CACHE[key] = background
+    return background
+
+
+def _init_thumbnail_worker(base_image_path: Path, size: tuple[int, int]) -> None:
+    # Forked workers inherit the parent's cache; spawned ones build the background once here.
+    load_background(base_image_path, size)
+    load_arrow_overlay(size)
+
+
 def load_font(font_candidates: list[Path], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    return _load_font_cached(tuple(font_candidates), size)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_font_cached(
+    font_candidates: tuple[Path, ...],
+    size: int,
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     bundled_candidates = [
         ROOT / "apps/site/assets/fonts/NotoSansCJKkr-Bold.otf",
         ROOT / "apps/site/assets/fonts/NotoSansCJKkr-Regular.otf",
         ROOT / "apps/site/assets/fonts/NotoSansKR-Bold.ttf",
         ROOT / "apps/site/assets/fonts/NotoSansKR-Regular.ttf",
     ]
-    preferred = font_candidates + [p for p in bundled_candidates if p not in font_candidates]
+    preferred = list(font_candidates) + [p for p in bundled_candidates if p not in font_candidates]
     for candidate in preferred:
         if candidate.exists():
             try:
@@ -67,6 +127,44 @@ def load_font(font_candidates: list[Path], size: int) -> ImageFont.FreeTypeFont
     return ImageFont.load_default()
 
 
+@functools.lru_cache(maxsize=8192)
+def _glyph_advance(font: ImageFont.FreeTypeFont | ImageFont.ImageFont, ch: str) -> float:
+    return font.getlength(ch)
+
+
+def text_advance(text: str, font: ImageFont.FreeTypeFont | ImageFont.ImageFont) -> float:
+    return sum(_glyph_advance(font, ch) for ch in text)
+
+
+def _longest_fitting_end(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    start: int,
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
+    max_width: int,
+) -> int:
+    # Exponential probe for a failing end, then binary search between the last fit and it.
+    total = len(text)
+    good = start
+    step = 1
+    while True:
+        probe = min(start + step, total)
+        if text_advance(text[start:probe], font) > max_width:
+            bad = probe
+            break
+        good = probe
+        if probe == total:
+            return total
+        step *= 2
+    while bad - good > 1:
+        mid = (good + bad) // 2
+        if text_advance(text[start:mid], font) <= max_width:
+            good = mid
+        else:
+            bad = mid
+    return good
+
+
 def wrap_title(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -79,35 +177,23 @@ def wrap_title(
         return [""]
 
     lines: list[str] = []
-    current = ""
-    idx = 0
-    while idx < len(compact):
-        ch = compact[idx]
-        test = current + ch
-        if draw.textlength(test, font=font) <= max_width:
-            current = test
-            idx += 1
-            continue
-        if current:
-            lines.append(current)
-            current = ""
-        else:
-            lines.append(ch)
-            idx += 1
-        if len(lines) >= max_lines:
-            break
+    start = 0
+    while start < len(compact) and len(lines) < max_lines:
+        end = _longest_fitting_end(draw, compact, start, font, max_width)
+        if end == start:
+            # A single glyph wider than the line still gets its own line.
+            end = start + 1
+        lines.append(compact[start:end])
+        start = end
 
-    if len(lines) < max_lines and current:
-        lines.append(current)
-
-    return lines[:max_lines]
+    return lines
 
 
 def extract_highlight_text(text: str) -> str:
     compact = " ".join(text.split())
     if not compact:
         return ""
-    amount_match = re.search(r"([0-9][0-9,\.]*(?:\s*)(?:만원|원|억원|천원|백만원|%))", compact)
+    amount_match = _AMOUNT_RE.search(compact)
     if amount_match:
         return amount_match.group(1).replace(" ", "")
     return ""
@@ -117,23 +203,11 @@ def compact_label(text: str, max_len: int = 16, max_items: int = 2) -> str:
     compact = " ".join(str(text or "").split())
     if not compact:
         return ""
-    normalized = (
-        compact.replace("，", ",")
-        .replace("ㆍ", ",")
-        .replace("·", ",")
-        .replace("/", ",")
-        .replace("|", ",")
-    )
+    normalized = compact.translate(_DELIM_TABLE)
     parts = [part.strip() for part in normalized.split(",") if part.strip()]
     if not parts:
         return compact[:max_len].strip()
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for part in parts:
-        if part in seen:
-            continue
-        seen.add(part)
-        deduped.append(part)
+    deduped = list(dict.fromkeys(parts))
     if len(deduped) <= max_items:
         label = ", ".join(deduped)
     else:
@@ -145,6 +219,26 @@ def compact_text_length(text: str) -> int:
     return len("".join(text.split()))
 
 
+def thumbnail_labels(region: str, target_group: str, category: str) -> tuple[str, str, str]:
+    return (
+        compact_label(region, max_len=10, max_items=1) or "전국",
+        compact_label(target_group, max_len=18, max_items=2) or "일반",
+        compact_label(category, max_len=14, max_items=1) or "정책",
+    )
+
+
+def render_key(rec: dict[str, Any]) -> tuple[str, ...]:
+    # Everything render_thumbnail actually draws; records with equal keys produce identical images.
+    title = str(rec.get("title", "")).strip()
+    benefit_text = str(rec.get("benefit_text", "")).strip()
+    labels = thumbnail_labels(
+        str(rec.get("region", "")).strip(),
+        str(rec.get("target_group", "")).strip(),
+        str(rec.get("category", "")).strip(),
+    )
+    return (*labels, extract_highlight_text(benefit_text) or extract_highlight_text(title))
+
+
 def size_by_char_count(
     text: str,
     max_size: int,
@@ -187,13 +281,25 @@ def trim_text_to_width(
         return ""
     if " " in candidate:
         words = candidate.split(" ")
-        while len(words) > 1 and draw.textlength(" ".join(words), font=font) > max_width:
-            words = words[:-1]
-        word_fit = " ".join(words).strip()
-        if word_fit and draw.textlength(word_fit, font=font) <= max_width:
+        word_widths = [text_advance(word, font) for word in words]
+        space_width = _glyph_advance(font, " ")
+        width = sum(word_widths) + space_width * (len(words) - 1)
+        while len(words) > 1 and width > max_width:
+            words.pop()
+            width -= word_widths.pop() + space_width
+        word_fit = " ".join(words)
+        if word_fit and width <= max_width:
             return word_fit
-    while candidate and draw.textlength(candidate, font=font) > max_width:
-        candidate = candidate[:-1].rstrip()
+    # Drop trailing characters while keeping a running width instead of re-measuring.
+    width = text_advance(candidate, font)
+    end = len(candidate)
+    while end and width > max_width:
+        end -= 1
+        width -= _glyph_advance(font, candidate[end])
+        while end and candidate[end - 1] == " ":
+            end -= 1
+            width -= _glyph_advance(font, " ")
+    candidate = candidate[:end]
     return candidate or "확인"
 
 
@@ -243,7 +349,7 @@ def draw_arrow_icon(
     arrow_color: tuple[int, int, int, int] = (255, 255, 255, 255),
 ) -> None:
     cx, cy = center
-    outer_r = 108
+    outer_r = ARROW_OUTER_RADIUS
     inner_r = 92
 
     draw.ellipse((cx - outer_r, cy - outer_r, cx + outer_r, cy + outer_r), fill=outer_color)
@@ -261,14 +367,32 @@ def draw_arrow_icon(
     draw.polygon(arrow_points, fill=arrow_color)
 
 
+@functools.lru_cache(maxsize=8)
+def load_arrow_overlay(size: tuple[int, int] = SIZE) -> tuple[Image.Image, tuple[int, int]]:
+    # Transparent tile holding only the icon; its position is fixed for a given size.
+    center_x = size[0] - 146
+    center_y = top_split_y(size) + 178
+    side = ARROW_OUTER_RADIUS * 2 + 1
+    origin = (center_x - ARROW_OUTER_RADIUS, center_y - ARROW_OUTER_RADIUS)
+    overlay = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    draw_arrow_icon(
+        ImageDraw.Draw(overlay, "RGBA"),
+        center=(ARROW_OUTER_RADIUS, ARROW_OUTER_RADIUS),
+        outer_color=(244, 247, 252, 255),
+        inner_color=(*BADGE_ORANGE, 255),
+        arrow_color=(255, 255, 255, 255),
+    )
+    return overlay, origin
+
+
 def draw_pill(
     draw: ImageDraw.ImageDraw,
     x: int,
     y: int,
     text: str,
     font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
-    fill_color: tuple[int, int, int, int],
-    text_color: tuple[int, int, int, int],
+    fill_color: tuple[int, int, int],
+    text_color: tuple[int, int, int],
 ) -> int:
     text_w, text_h = text_size(draw, text, font)
     width = text_w + 46
@@ -288,29 +412,14 @@ def render_thumbnail(
     benefit_text: str,
     font_paths: list[Path],
     size: tuple[int, int] = SIZE,
+    optimize: bool = False,
 ) -> None:
-    with Image.open(base_image_path) as base_image:
-        fitted = fit_cover(base_image.convert("RGB"), size)
+    canvas = load_background(base_image_path, size).copy()
+    draw = ImageDraw.Draw(canvas)
 
-    navy = (13, 49, 146)
-    blue = (41, 101, 241)
-    sky = (85, 186, 255)
-    top_bg = (248, 246, 238)
-    ink = (18, 24, 39)
-    off_white = (246, 250, 255)
-    badge_orange = (255, 116, 39)
-    pill_bg = (224, 236, 255)
-    canvas = Image.blend(fitted, Image.new("RGB", size, navy), 0.84).convert("RGBA")
-    draw = ImageDraw.Draw(canvas, "RGBA")
-
-    safe_region = compact_label(region, max_len=10, max_items=1) or "전국"
-    safe_target = compact_label(target_group, max_len=18, max_items=2) or "일반"
-    safe_category = compact_label(category, max_len=14, max_items=1) or "정책"
-
-    top_split = int(size[1] * 0.48)
-    draw.rectangle((6, 6, size[0] - 6, top_split), fill=(*top_bg, 255))
-    draw.rectangle((0, top_split + 1, size[0], size[1]), fill=(*blue, 255))
-    draw.rounded_rectangle((42, 26, 58, 178), radius=8, fill=(*sky, 255))
+    safe_region, safe_target, safe_category = thumbnail_labels(region, target_group, category)
+
+    top_split = top_split_y(size)
 
     headline_text = f"{safe_category} 지원"
     headline_font = fit_single_line_font(
@@ -327,9 +436,9 @@ def render_thumbnail(
         ((size[0] - headline_w) // 2, 24),
         headline_text,
         font=headline_font,
-        fill=(*ink, 255),
+        fill=INK,
         stroke_width=2,
-        stroke_fill=(*ink, 255),
+        stroke_fill=INK,
     )
 
     highlight_seed = extract_highlight_text(benefit_text) or extract_highlight_text(title)
@@ -349,12 +458,12 @@ def render_thumbnail(
     amount_text = trim_text_to_width(draw, amount_text, amount_font, size[0] - 120)
     amount_w, amount_h = text_size(draw, amount_text, amount_font)
     amount_y = 28 + headline_h + 34
-    draw.text(((size[0] - amount_w) // 2, amount_y), amount_text, font=amount_font, fill=(*navy, 255))
+    draw.text(((size[0] - amount_w) // 2, amount_y), amount_text, font=amount_font, fill=NAVY)
 
     divider_w = int(size[0] * 0.48)
     divider_x1 = (size[0] - divider_w) // 2
     divider_y = amount_y + amount_h + 20
-    draw.rounded_rectangle((divider_x1, divider_y, divider_x1 + divider_w, divider_y + 10), radius=7, fill=(*sky, 255))
+    draw.rounded_rectangle((divider_x1, divider_y, divider_x1 + divider_w, divider_y + 10), radius=7, fill=SKY)
 
     pill_seed = f"{safe_region}{safe_target}"
     pill_font = fit_single_line_font(
@@ -374,8 +483,8 @@ def render_thumbnail(
         y=pill_y,
         text=pill_region_text or "전국",
         font=pill_font,
-        fill_color=(*pill_bg, 255),
-        text_color=(*navy, 255),
+        fill_color=PILL_BG,
+        text_color=NAVY,
     )
     draw_pill(
         draw,
@@ -383,8 +492,8 @@ def render_thumbnail(
         y=pill_y,
         text=pill_target_text or "일반",
         font=pill_font,
-        fill_color=(*pill_bg, 255),
-        text_color=(*navy, 255),
+        fill_color=PILL_BG,
+        text_color=NAVY,
     )
 
     cta_primary = f"나도 {safe_target} 대상자?"
@@ -412,10 +521,10 @@ def render_thumbnail(
 
     left_x = 48
     first_y = top_split + 70
-    draw.text((left_x, first_y), primary_line, font=cta_font, fill=(*off_white, 255))
+    draw.text((left_x, first_y), primary_line, font=cta_font, fill=OFF_WHITE)
     _, first_h = text_size(draw, primary_line, cta_font)
     second_y = first_y + first_h + 14
-    draw.text((left_x, second_y), secondary_line, font=secondary_font, fill=(*off_white, 255))
+    draw.text((left_x, second_y), secondary_line, font=secondary_font, fill=OFF_WHITE)
 
     badge_text = "지금 확인"
     badge_font = fit_single_line_font(draw, badge_text, font_paths, max_width=250, start_size=42, min_size=30)
@@ -425,23 +534,63 @@ def render_thumbnail(
     draw.rounded_rectangle(
         (badge_x, badge_y, badge_x + badge_w + 48, badge_y + badge_h + 24),
         radius=18,
-        fill=(*badge_orange, 255),
+        fill=BADGE_ORANGE,
     )
-    draw.text((badge_x + 24, badge_y + 12), badge_text, font=badge_font, fill=(255, 255, 255, 255))
-
-    draw_arrow_icon(
-        draw,
-        center=(size[0] - 146, top_split + 178),
-        outer_color=(244, 247, 252, 255),
-        inner_color=(*badge_orange, 255),
-        arrow_color=(255, 255, 255, 255),
+    draw.text((badge_x + 24, badge_y + 12), badge_text, font=badge_font, fill=(255, 255, 255))
+
+    # The icon overlaps the badge, so it is pasted last.
+    arrow_overlay, arrow_origin = load_arrow_overlay(size)
+    canvas.paste(arrow_overlay, arrow_origin, arrow_overlay)
+
+    buffer = io.BytesIO()
+    canvas.save(
+        buffer,
+        format="JPEG",
+        quality=JPEG_QUALITY,
+        optimize=optimize,
+        progressive=False,
+        subsampling=2,
     )
+    write_bytes_if_changed(output_path, buffer.getvalue())
+
+
+def _render_thumbnail_task(kwargs: dict[str, Any]) -> Exception | None:
+    try:
+        render_thumbnail(**kwargs)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+    return None
+
+
+def _render_in_processes(
+    jobs: list[dict[str, Any]], base_image_path: Path, workers: int
+) -> list[Exception | None]:
+    # Rendering is CPU-bound Pillow work, so fan it out across processes in chunks.
+    # Building the background first lets forked workers inherit it.
+    load_background(base_image_path, SIZE)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_thumbnail_worker,
+        initargs=(base_image_path, SIZE),
+    ) as executor:
+        return list(
+            executor.map(
+                _render_thumbnail_task,
+                jobs,
+                chunksize=max(1, len(jobs) // (workers * 4)),
+            )
+        )
 
-    for i in range(4):
-        draw.rectangle((i, i, size[0] - 1 - i, size[1] - 1 - i), outline=(*navy, 255), width=1)
 
-    ensure_dir(output_path.parent)
-    canvas.convert("RGB").save(output_path, format="JPEG", quality=90, optimize=True)
+def thumbnail_item(policy_id: str, slug: str, rec: dict[str, Any], site_base_url: str) -> dict[str, str]:
+    relative_path = f"/assets/thumbnails/{slug}.jpg"
+    return {
+        "policy_id": policy_id,
+        "slug": slug,
+        "relative_path": relative_path,
+        "public_url": f"{site_base_url.rstrip('/')}{relative_path}",
+        "official_url": str(rec.get("official_url", "")).strip(),
+    }
 
 
 def generate_thumbnails_for_policies(
@@ -450,44 +599,79 @@ def generate_thumbnails_for_policies(
     output_dir: Path,
     site_base_url: str,
     font_paths: list[Path],
+    optimize: bool = False,
 ) -> dict[str, Any]:
     if not base_image_path.exists():
         raise RuntimeError(f"thumbnail base image not found: {base_image_path}")
 
     ensure_dir(output_dir)
 
-    items: list[dict[str, str]] = []
-    errors: list[dict[str, str]] = []
+    tasks: list[tuple[str, str, Path, dict[str, Any]]] = []
     for rec in policies:
         policy_id = str(rec.get("policy_id", "")).strip()
         if not policy_id:
             continue
         slug = slugify(policy_id)
-        output_path = output_dir / f"{slug}.jpg"
+        tasks.append((policy_id, slug, output_dir / f"{slug}.jpg", rec))
+
+    # Render each distinct image once; duplicates are copied from the first output.
+    first_by_key: dict[tuple[str, ...], int] = {}
+    source_idx: list[int] = []
+    for idx, (_, _, _, rec) in enumerate(tasks):
+        source_idx.append(first_by_key.setdefault(render_key(rec), idx))
+    unique_tasks = [(idx, tasks[idx]) for idx in first_by_key.values()]
+
+    results: list[Exception | None] = [None] * len(tasks)
+    jobs = [
+        {
+            "base_image_path": base_image_path,
+            "output_path": output_path,
+            "title": str(rec.get("title", "")).strip(),
+            "region": str(rec.get("region", "")).strip(),
+            "target_group": str(rec.get("target_group", "")).strip(),
+            "category": str(rec.get("category", "")).strip(),
+            "benefit_text": str(rec.get("benefit_text", "")).strip(),
+            "font_paths": font_paths,
+            "optimize": optimize,
+        }
+        for _, (_, _, output_path, rec) in unique_tasks
+    ]
+    if jobs:
+        workers = os.cpu_count() or 1
+        outcomes: list[Exception | None] | None = None
+        # Processes only pay off for batches large enough to amortize worker start-up.
+        if workers > 1 and len(jobs) >= workers * 2:
+            try:
+                outcomes = _render_in_processes(jobs, base_image_path, workers)
+            except Exception:  # noqa: BLE001
+                # No process pool here (no semaphores in some sandboxes), a worker died (BrokenProcessPool)
+                # or a result could not be pickled back: render on threads so failures stay per-thumbnail.
+                outcomes = None
+        if outcomes is None:
+            # Pillow releases the GIL during JPEG encoding, so threads still overlap there.
+            with ThreadPoolExecutor(max_workers=min(8, workers)) as executor:
+                outcomes = list(executor.map(_render_thumbnail_task, jobs))
+        for (idx, _), exc in zip(unique_tasks, outcomes):
+            results[idx] = exc
+
+    for idx, src in enumerate(source_idx):
+        if src == idx:
+            continue
+        if results[src] is not None:
+            results[idx] = results[src]
+            continue
         try:
-            render_thumbnail(
-                base_image_path=base_image_path,
-                output_path=output_path,
-                title=str(rec.get("title", "")).strip(),
-                region=str(rec.get("region", "")).strip(),
-                target_group=str(rec.get("target_group", "")).strip(),
-                category=str(rec.get("category", "")).strip(),
-                benefit_text=str(rec.get("benefit_text", "")).strip(),
-                font_paths=font_paths,
-            )
-            relative_path = f"/assets/thumbnails/{slug}.jpg"
-            public_url = f"{site_base_url.rstrip('/')}{relative_path}"
-            items.append(
-                {
-                    "policy_id": policy_id,
-                    "slug": slug,
-                    "relative_path": relative_path,
-                    "public_url": public_url,
-                    "official_url": str(rec.get("official_url", "")).strip(),
-                }
-            )
-        except Exception as exc:  # noqa: BLE001
+            write_bytes_if_changed(tasks[idx][2], tasks[src][2].read_bytes())
+        except OSError as exc:
+            results[idx] = exc
+
+    items: list[dict[str, str]] = []
+    errors: list[dict[str, str]] = []
+    for (policy_id, slug, _, rec), exc in zip(tasks, results):
+        if exc is not None:
             errors.append({"policy_id": policy_id, "slug": slug, "error": str(exc)})
+            continue
+        items.append(thumbnail_item(policy_id, slug, rec, site_base_url))
 
     return {"generated": len(items), "errors": errors, "items": items}
 
@@ -499,6 +683,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output-dir", default="apps/site/dist/assets/thumbnails")
     parser.add_argument("--site-base-url", default="https://pol.cbbxs.com")
     parser.add_argument("--manifest-out", default="artifacts/latest/frontend/thumbnails.json")
+    parser.add_argument("--final", action="store_true", help="Optimize JPEG Huffman tables (slower, smaller files)")
     return parser.parse_args()
 
 
@@ -538,6 +723,7 @@ def main() -> int:
             ROOT / "apps/site/assets/fonts/NotoSansKR-Bold.ttf",
             ROOT / "apps/site/assets/fonts/NotoSansKR-Regular.ttf",
         ],
+        optimize=args.final,
     )
     write_json(manifest_out, result["items"])
     print(f"generated thumbnails: {result['generated']}")
@@ -5,20 +5,38 @@ import argparse
 import datetime as dt
 import json
 import os
-import shutil
+import re
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib.error import HTTPError, URLError
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any
 
+try:
+    import urllib3  # type: ignore
+except Exception:  # pragma: no cover
+    urllib3 = None
+
 from runtime_guard import enforce_venv
-from pipeline_lib import ROOT, now_iso, write_json
+from pipeline_lib import ROOT, now_iso, save_canonical_with_rotation, write_json_gz
 
 
 ANNOUNCEMENT_ENDPOINT = "https://apis.data.go.kr/B552735/kisedKstartupService01/getAnnouncementInformation01"
+_NONDIGIT = re.compile(r"\D")
+
+# One keep-alive pool shared by the page workers instead of a new TLS handshake per page.
+if urllib3 is not None:
+    _HTTP = urllib3.PoolManager(
+        maxsize=8,
+        retries=urllib3.Retry(total=3, backoff_factor=0.4, status_forcelist=(500, 502, 503, 504)),
+    )
+    FETCH_ERRORS: tuple[type[Exception], ...] = (HTTPError, URLError, ET.ParseError, urllib3.exceptions.HTTPError)
+else:
+    _HTTP = None
+    FETCH_ERRORS = (HTTPError, URLError, ET.ParseError)
 
 
 def parse_args() -> argparse.Namespace:
@@ -26,6 +44,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cutoff-date", default="20250701", help="Include rows where start_date >= cutoff (YYYYMMDD)")
     parser.add_argument("--per-page", type=int, default=200, help="Page size for source API")
     parser.add_argument("--max-pages", type=int, default=300, help="Max pages to fetch")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent page requests")
     parser.add_argument("--site-base-url", default="https://pol.cbbxs.com", help="Canonical base URL for generated records")
     return parser.parse_args()
 
@@ -43,7 +62,7 @@ def load_env(path: Path) -> None:
 
 
 def safe_date(value: str) -> str:
-    digits = "".join(ch for ch in (value or "") if ch.isdigit())
+    digits = _NONDIGIT.sub("", value or "")
     if len(digits) >= 8:
         return digits[:8]
     return ""
@@ -59,6 +78,21 @@ def parse_col_item(item: ET.Element) -> dict[str, str]:
     return row
 
 
+def parse_items(stream: Any) -> list[dict[str, str]]:
+    rows: list[dict[str, str]] = []
+    path: list[str] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(elem.tag)
+            continue
+        path.pop()
+        # Only ./data/item rows, matching the previous findall path.
+        if elem.tag == "item" and len(path) == 2 and path[1] == "data":
+            rows.append(parse_col_item(elem))
+            elem.clear()
+    return rows
+
+
 def fetch_page(service_key: str, page: int, per_page: int) -> list[dict[str, str]]:
     params = {
         "serviceKey": service_key,
@@ -66,37 +100,57 @@ def fetch_page(service_key: str, page: int, per_page: int) -> list[dict[str, str
         "perPage": per_page,
     }
     url = ANNOUNCEMENT_ENDPOINT + "?" + urllib.parse.urlencode(params)
+    if _HTTP is not None:
+        resp = _HTTP.request("GET", url, timeout=30, preload_content=False)
+        try:
+            if resp.status >= 400:
+                raise HTTPError(url, resp.status, resp.reason or "", resp.headers, None)
+            return parse_items(resp)
+        finally:
+            resp.release_conn()
     req = urllib.request.Request(url, method="GET")
     with urllib.request.urlopen(req, timeout=30) as resp:
-        body = resp.read().decode("utf-8", errors="replace")
-    root = ET.fromstring(body)
-    items = root.findall("./data/item")
-    return [parse_col_item(item) for item in items]
+        return parse_items(resp)
+
 
+def fetch_page_with_retry(service_key: str, page: int, per_page: int) -> list[dict[str, str]]:
+    # The pooled client retries connection errors and 5xx itself; a truncated or garbled body still needs a retry here.
+    retry_on = (ET.ParseError,) if _HTTP is not None else FETCH_ERRORS
+    last_error: Exception | None = None
+    for _ in range(3):
+        try:
+            return fetch_page(service_key, page, per_page)
+        except retry_on as exc:
+            last_error = exc
+            time.sleep(0.4)
+    assert last_error is not None
+    raise last_error
 
-def fetch_all(service_key: str, per_page: int, max_pages: int) -> list[dict[str, str]]:
+
+def fetch_all(service_key: str, per_page: int, max_pages: int, workers: int = 8) -> list[dict[str, str]]:
     rows: list[dict[str, str]] = []
-    for page in range(1, max_pages + 1):
-        page_rows: list[dict[str, str]] = []
-        last_error: Exception | None = None
-        for _ in range(3):
+    workers = max(1, workers)
+    pending: dict[int, Future[list[dict[str, str]]]] = {}
+    next_page = 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for page in range(1, max_pages + 1):
+            while next_page <= max_pages and len(pending) < workers:
+                pending[next_page] = pool.submit(fetch_page_with_retry, service_key, next_page, per_page)
+                next_page += 1
             try:
-                page_rows = fetch_page(service_key, page, per_page)
-                last_error = None
+                page_rows = pending.pop(page).result()
+            except FETCH_ERRORS:
+                if page == 1:
+                    raise
+                # Some public APIs return 5xx after the last available page.
+                break
+            if not page_rows:
                 break
-            except (HTTPError, URLError, ET.ParseError) as exc:
-                last_error = exc
-                time.sleep(0.4)
-        if last_error is not None:
-            if page == 1:
-                raise last_error
-            # Some public APIs return 5xx after the last available page.
-            break
-        if not page_rows:
-            break
-        rows.extend(page_rows)
-        if len(page_rows) < per_page:
-            break
+            rows.extend(page_rows)
+            if len(page_rows) < per_page:
+                break
+        for future in pending.values():
+            future.cancel()
     return rows
 
 
@@ -111,8 +165,9 @@ def normalize_official_url(row: dict[str, str]) -> str:
     return "https://www.k-startup.go.kr"
 
 
-def build_period_text(row: dict[str, str]) -> str:
-    start = safe_date(row.get("pbanc_rcpt_bgng_dt", ""))
+def build_period_text(row: dict[str, str], start: str | None = None) -> str:
+    if start is None:
+        start = safe_date(row.get("pbanc_rcpt_bgng_dt", ""))
     end = safe_date(row.get("pbanc_rcpt_end_dt", ""))
     if start and end:
         return f"{start} ~ {end}"
@@ -121,53 +176,48 @@ def build_period_text(row: dict[str, str]) -> str:
     return "공고문 참고"
 
 
+def _text(row: dict[str, str], key: str, default: str) -> str:
+    return (row.get(key) or default).strip() or default
+
+
+def build_canonical_record(row: dict[str, str], policy_id: str, title: str, start: str, now: str) -> dict[str, Any]:
+    return {
+        "policy_id": policy_id,
+        "title": title,
+        "region": _text(row, "supt_regin", "전국"),
+        "target_group": _text(row, "aply_trgt", "일반"),
+        "category": _text(row, "supt_biz_clsfc", "창업"),
+        "eligibility_text": _text(row, "aply_trgt_ctnt", "공고문 참고"),
+        "benefit_text": _text(row, "pbanc_ctnt", "공고문 참고"),
+        "application_period_text": build_period_text(row, start),
+        "official_url": normalize_official_url(row),
+        "source_org": (row.get("sprv_inst") or row.get("pbanc_ntrp_nm") or "kstartup").strip() or "kstartup",
+        "source_updated_at": start or now,
+        "last_checked_at": now,
+        "status": "active" if (row.get("rcrt_prgs_yn") or "").strip().upper() == "Y" else "closed",
+        "source_api": "kr_policy_kstartup_announcement",
+    }
+
+
 def to_canonical(rows: list[dict[str, str]], cutoff_date: str) -> list[dict[str, Any]]:
     now = now_iso()
     out: list[dict[str, Any]] = []
     seen: set[str] = set()
+    seen_add = seen.add
     for row in rows:
-        start = safe_date(row.get("pbanc_rcpt_bgng_dt", ""))
+        get = row.get
+        start = safe_date(get("pbanc_rcpt_bgng_dt", ""))
         if not start or start < cutoff_date:
             continue
-        policy_id = (row.get("pbanc_sn") or row.get("id") or "").strip()
-        title = (row.get("biz_pbanc_nm") or "").strip()
-        if not policy_id or not title:
-            continue
-        if policy_id in seen:
+        policy_id = (get("pbanc_sn") or get("id") or "").strip()
+        title = (get("biz_pbanc_nm") or "").strip()
+        if not policy_id or not title or policy_id in seen:
             continue
-        seen.add(policy_id)
-        status = "active" if (row.get("rcrt_prgs_yn") or "").strip().upper() == "Y" else "closed"
-        out.append(
-            {
-                "policy_id": policy_id,
-                "title": title,
-                "region": (row.get("supt_regin") or "전국").strip() or "전국",
-                "target_group": (row.get("aply_trgt") or "일반").strip() or "일반",
-                "category": (row.get("supt_biz_clsfc") or "창업").strip() or "창업",
-                "eligibility_text": (row.get("aply_trgt_ctnt") or "공고문 참고").strip() or "공고문 참고",
-                "benefit_text": (row.get("pbanc_ctnt") or "공고문 참고").strip() or "공고문 참고",
-                "application_period_text": build_period_text(row),
-                "official_url": normalize_official_url(row),
-                "source_org": (row.get("sprv_inst") or row.get("pbanc_ntrp_nm") or "kstartup").strip() or "kstartup",
-                "source_updated_at": start or now,
-                "last_checked_at": now,
-                "status": status,
-                "source_api": "kr_policy_kstartup_announcement",
-            }
-        )
+        seen_add(policy_id)
+        out.append(build_canonical_record(row, policy_id, title, start, now))
     return out
 
 
-def rotate_and_write_canonical(canonical_rows: list[dict[str, Any]]) -> None:
-    latest_path = ROOT / "data" / "canonical" / "latest" / "policies.json"
-    previous_path = ROOT / "data" / "canonical" / "previous" / "policies.json"
-    latest_path.parent.mkdir(parents=True, exist_ok=True)
-    previous_path.parent.mkdir(parents=True, exist_ok=True)
-    if latest_path.exists():
-        shutil.copy2(latest_path, previous_path)
-    write_json(latest_path, canonical_rows)
-
-
 def main() -> int:
     enforce_venv()
     args = parse_args()
@@ -177,16 +227,16 @@ def main() -> int:
     if not service_key:
         raise RuntimeError("DATA_GO_KR_API_KEY is required")
 
-    all_rows = fetch_all(service_key, args.per_page, args.max_pages)
+    all_rows = fetch_all(service_key, args.per_page, args.max_pages, args.workers)
     canonical_rows = to_canonical(all_rows, args.cutoff_date)
 
     today = dt.date.today().isoformat()
     raw_dir = ROOT / "data" / "raw" / today
     raw_dir.mkdir(parents=True, exist_ok=True)
-    write_json(raw_dir / "kr_policy_kstartup_announcement_all.json", all_rows)
-    write_json(raw_dir / f"kr_policy_kstartup_announcement_from_{args.cutoff_date}.json", canonical_rows)
+    write_json_gz(raw_dir / "kr_policy_kstartup_announcement_all.json.gz", all_rows)
+    write_json_gz(raw_dir / f"kr_policy_kstartup_announcement_from_{args.cutoff_date}.json.gz", canonical_rows)
 
-    rotate_and_write_canonical(canonical_rows)
+    save_canonical_with_rotation(canonical_rows)
 
     summary = {
         "cutoff_date": args.cutoff_date,
@@ -2,22 +2,50 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import gzip
 import hashlib
+import importlib.util
 import json
+import mmap
 import os
 import re
 import shutil
 import sys
+import urllib.error
 import urllib.parse
 import urllib.request
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
+
+try:
+    import ijson  # type: ignore
+except Exception:  # pragma: no cover
+    ijson = None
 
 try:
     import jsonschema  # type: ignore
 except Exception:  # pragma: no cover
     jsonschema = None
 
+try:
+    import fastjsonschema  # type: ignore
+except Exception:  # pragma: no cover
+    fastjsonschema = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+try:
+    import urllib3  # type: ignore
+except Exception:  # pragma: no cover
+    urllib3 = None
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -37,6 +65,23 @@ REQUIRED_POLICY_FIELDS = [
     "status",
 ]
 
+# Shared keep-alive pool for source fetches; falls back to urllib when urllib3 is missing.
+_HTTP = (
+    urllib3.PoolManager(num_pools=32, maxsize=16, retries=urllib3.Retry(total=2, backoff_factor=0.2))
+    if urllib3 is not None
+    else None
+)
+
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATORS = re.compile(r"[\s_-]+")
+_YYYYMMDD = re.compile(r"(?<!\d)(\d{8})(?!\d)")
+# Either a separated date or a standalone YYYYMMDD run; the last match is the period end.
+_PERIOD_DATE = re.compile(r"(\d{4})[-./](\d{2})[-./](\d{2})|(?<!\d)(\d{8})(?!\d)")
+_FIRST_SENT = re.compile(r"(.+?[.!?])(?:\s|$)")
+_LIST_BULLET = re.compile(r"^[\-\*\u2022\u25CB\u25CF\s]+")
+_LIST_NUM = re.compile(r"^[0-9]+\)")
+_LIST_CIRCLED = re.compile(r"^[①-⑳]")
+
 
 def now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).astimezone().isoformat()
@@ -46,28 +91,177 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def loads_json_bytes(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def read_json(path: Path) -> Any:
+    if path.suffix == ".gz":
+        return loads_json_bytes(gzip.decompress(path.read_bytes()))
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def write_json(path: Path, data: Any) -> None:
+@functools.lru_cache(maxsize=64)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    return read_json(Path(path))
+
+
+def read_json_cached(path: Path) -> Any:
+    # For small config/schema files; the parsed object is shared between callers, so treat it as read-only.
+    st = path.stat()
+    return _read_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def read_json_large(path: Path) -> Any:
+    # Canonical dumps can be large: parse straight from a read-only mapping instead of a bytes copy.
+    if orjson is None or path.suffix == ".gz" or path.stat().st_size == 0:
+        return read_json(path)
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _open_json_binary(path: Path) -> BinaryIO:
+    return gzip.open(path, "rb") if path.suffix == ".gz" else path.open("rb")
+
+
+def iter_json_array(path: Path) -> Iterator[Any]:
+    with _open_json_binary(path) as f:
+        head = f.read(64).lstrip()
+    if not head.startswith(b"["):
+        raise ValueError(f"expected a JSON array: {path}")
+    if ijson is None:
+        return iter(read_json(path))
+    return _iter_json_items(path)
+
+
+def _iter_json_items(path: Path) -> Iterator[Any]:
+    with _open_json_binary(path) as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_bytes_if_changed(path: Path, payload: bytes, durable: bool = False) -> bool:
+    try:
+        if path.stat().st_size == len(payload) and path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
     ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_path = path.with_name(path.name + ".tmp")
+    write_bytes(tmp_path, payload, durable=durable)
+    os.replace(tmp_path, path)
+    return True
 
 
-def read_json_subset_yaml(path: Path) -> dict[str, Any]:
+def write_json_gz(path: Path, data: Any) -> None:
+    # Compact, fast-compressed dump for machine-read archives.
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    # mtime=0 keeps the gzip header stable, so unchanged data leaves the file untouched.
+    write_bytes_if_changed(path, gzip.compress(payload, compresslevel=1, mtime=0))
+
+
+def write_json(path: Path, data: Any, durable: bool = False) -> None:
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    write_bytes_if_changed(path, payload, durable=durable)
+
+
+@functools.lru_cache(maxsize=16)
+def _read_json_subset_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
     # YAML superset: config file is written in JSON-compatible YAML.
-    text = path.read_text(encoding="utf-8").strip()
+    text = Path(path).read_text(encoding="utf-8").strip()
     return json.loads(text)
 
 
-def validate_schema(instance: Any, schema_path: Path) -> list[str]:
+def read_json_subset_yaml(path: Path) -> dict[str, Any]:
+    st = path.stat()
+    return _read_json_subset_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+# fastjsonschema implements draft-04/06/07 only (draft-07 for any other $schema), so its answer is only
+# final for schemas that declare one of those drafts themselves.
+_FAST_PATH_DRAFTS = ("Draft4Validator", "Draft6Validator", "Draft7Validator")
+GENERATED_VALIDATORS_DIR = Path(__file__).resolve().parent / "_generated_validators"
+_VALIDATE_DEF = re.compile(r"^def (validate\w*)\(", re.M)
+
+
+def load_generated_validator(schema: Any, schema_path: Path) -> Any:
+    # fastjsonschema's generated source is kept on disk per schema content and library
+    # version, so later runs import it (and its .pyc) instead of regenerating code.
+    digest = hashlib.sha256(
+        f"{fastjsonschema.VERSION}\n{json.dumps(schema, sort_keys=True)}".encode("utf-8")
+    ).hexdigest()[:16]
+    module_name = f"{schema_path.name.split('.')[0]}_{digest}"
+    module_path = GENERATED_VALIDATORS_DIR / f"{module_name}.py"
+    if not module_path.exists():
+        code = fastjsonschema.compile_to_code(schema, use_formats=False)
+        write_bytes_if_changed(module_path, code.encode("utf-8"))
+    code = module_path.read_text(encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # The root validator is the first generated function; its name follows the schema $id.
+    return getattr(module, _VALIDATE_DEF.search(code).group(1))
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_validators(schema_path: str, mtime_ns: int) -> tuple[Any, Any]:
+    schema = read_json(Path(schema_path))
     if jsonschema is None:
+        return None, None
+    # Honour the schema's own $schema draft (2020-12 when absent) and reject malformed schemas up front.
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    full = validator_cls(schema)
+    fast = None
+    if fastjsonschema is not None and validator_cls.__name__ in _FAST_PATH_DRAFTS:
+        try:
+            fast = load_generated_validator(schema, Path(schema_path))
+        except Exception:  # noqa: BLE001
+            fast = None
+    return fast, full
+
+
+def is_schema_valid(instance: Any, schema_path: Path) -> bool:
+    if jsonschema is None:
+        return True
+    fast, validator = _schema_validators(str(schema_path), schema_path.stat().st_mtime_ns)
+    if fast is not None:
+        try:
+            fast(instance)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            pass
+    return validator.is_valid(instance)
+
+
+def validate_schema(instance: Any, schema_path: Path) -> list[str]:
+    # Pass/fail first; the sorted error list is only built for invalid instances.
+    if is_schema_valid(instance, schema_path):
         return []
-    schema = read_json(schema_path)
-    validator = jsonschema.Draft202012Validator(schema)
+    _, validator = _schema_validators(str(schema_path), schema_path.stat().st_mtime_ns)
     errors = sorted(validator.iter_errors(instance), key=lambda e: e.path)
     out: list[str] = []
     for err in errors:
@@ -75,68 +269,85 @@ def validate_schema(instance: Any, schema_path: Path) -> list[str]:
     return out
 
 
+@functools.lru_cache(maxsize=8192)
 def slugify(value: str) -> str:
     value = value.strip().lower()
-    value = re.sub(r"[^\w\s-]", "", value)
-    value = re.sub(r"[\s_]+", "-", value)
-    value = re.sub(r"-+", "-", value).strip("-")
+    value = _SLUG_NONWORD.sub("", value)
+    value = _SLUG_SEPARATORS.sub("-", value).strip("-")
     return value or "unknown"
 
 
+@functools.lru_cache(maxsize=64)
+def _items_path_tokens(items_path: str) -> tuple[str, ...]:
+    return tuple(items_path.split("."))
+
+
+def dict_items(values: list[Any]) -> list[dict[str, Any]]:
+    return list(filter(dict.__instancecheck__, values))
+
+
 def read_items_path(payload: Any, items_path: str) -> list[dict[str, Any]]:
     if items_path == "":
         if isinstance(payload, list):
-            return [x for x in payload if isinstance(x, dict)]
+            return dict_items(payload)
         return []
     cur = payload
-    for token in items_path.split("."):
+    for token in _items_path_tokens(items_path):
         if isinstance(cur, dict) and token in cur:
             cur = cur[token]
         else:
             return []
     if isinstance(cur, list):
-        return [x for x in cur if isinstance(x, dict)]
+        return dict_items(cur)
     return []
 
 
-def apply_auth(url: str, auth: dict[str, Any]) -> str:
+def auth_params(auth: dict[str, Any]) -> dict[str, str]:
     auth_type = (auth or {}).get("type", "none")
     if auth_type == "none":
-        return url
+        return {}
     if auth_type == "query_key":
         env_key = auth.get("env_key")
         param_name = auth.get("param_name", "serviceKey")
         value = os.getenv(env_key or "")
         if not value:
             raise RuntimeError(f"missing secret env: {env_key}")
-        parsed = urllib.parse.urlparse(url)
-        query = urllib.parse.parse_qs(parsed.query)
-        query[param_name] = [value]
-        new_query = urllib.parse.urlencode(query, doseq=True)
-        return urllib.parse.urlunparse(
-            (
-                parsed.scheme,
-                parsed.netloc,
-                parsed.path,
-                parsed.params,
-                new_query,
-                parsed.fragment,
-            )
-        )
+        return {param_name: value}
     raise RuntimeError(f"unsupported auth type: {auth_type}")
 
 
-def build_url(base: str, params: dict[str, Any]) -> str:
-    if not params:
+@functools.lru_cache(maxsize=128)
+def _split_base(base: str) -> tuple[urllib.parse.SplitResult, tuple[tuple[str, list[str]], ...]]:
+    split = urllib.parse.urlsplit(base)
+    return split, tuple(urllib.parse.parse_qs(split.query).items())
+
+
+def build_url(base: str, params: dict[str, Any], auth: dict[str, str] | None = None) -> str:
+    if not params and not auth:
         return base
-    parsed = urllib.parse.urlparse(base)
-    query = urllib.parse.parse_qs(parsed.query)
+    split, base_query = _split_base(base)
+    query = dict(base_query)
     for k, v in params.items():
         query[k] = [str(v)]
-    new_query = urllib.parse.urlencode(query, doseq=True)
-    return urllib.parse.urlunparse(
-        (parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment)
-    )
+    for k, v in (auth or {}).items():
+        query[k] = [v]
+    return urllib.parse.urlunsplit(split._replace(query=urllib.parse.urlencode(query, doseq=True)))
+
+
+def http_get_json(url: str, timeout: float = 20) -> Any:
+    if _HTTP is not None:
+        resp = _HTTP.request(
+            "GET",
+            url,
+            timeout=urllib3.Timeout(total=timeout),
+            headers={"Accept-Encoding": "gzip"},
+        )
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason or "", resp.headers, None)
+        return loads_json_bytes(resp.data)
+    req = urllib.request.Request(url, method="GET")
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return loads_json_bytes(resp.read())
 
 
 def fetch_source(source: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
@@ -152,7 +363,7 @@ def fetch_source(source: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str
             payload = read_json(ROOT / source["endpoint"])
             items = read_items_path(payload, items_path) if items_path else payload
             if isinstance(items, list):
-                rows = [x for x in items if isinstance(x, dict)]
+                rows = dict_items(items)
             else:
                 rows = []
             report["ok"] = True
@@ -163,11 +374,8 @@ def fetch_source(source: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str
             rows: list[dict[str, Any]] = []
             mode = pagination.get("mode", "none")
             if mode == "none":
-                url = build_url(source["endpoint"], source.get("params", {}))
-                url = apply_auth(url, source.get("auth", {}))
-                req = urllib.request.Request(url, method="GET")
-                with urllib.request.urlopen(req, timeout=20) as resp:
-                    payload = json.loads(resp.read().decode("utf-8"))
+                url = build_url(source["endpoint"], source.get("params", {}), auth_params(source.get("auth", {})))
+                payload = http_get_json(url)
                 rows = read_items_path(payload, items_path)
             elif mode == "page":
                 page_param = pagination.get("page_param", "page")
@@ -175,15 +383,13 @@ def fetch_source(source: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str
                 start_page = int(pagination.get("start_page", 1))
                 max_pages = int(pagination.get("max_pages", 3))
                 page_size = int(source.get("params", {}).get(size_param, 100))
+                auth = auth_params(source.get("auth", {}))
                 for page in range(start_page, start_page + max_pages):
                     params = dict(source.get("params", {}))
                     params[page_param] = page
                     params[size_param] = page_size
-                    url = build_url(source["endpoint"], params)
-                    url = apply_auth(url, source.get("auth", {}))
-                    req = urllib.request.Request(url, method="GET")
-                    with urllib.request.urlopen(req, timeout=20) as resp:
-                        payload = json.loads(resp.read().decode("utf-8"))
+                    url = build_url(source["endpoint"], params, auth)
+                    payload = http_get_json(url)
                     part = read_items_path(payload, items_path)
                     rows.extend(part)
                     if len(part) < page_size:
@@ -200,6 +406,56 @@ def fetch_source(source: dict[str, Any]) -> tuple[list[dict[str, Any]], dict[str
         return [], report
 
 
+def fetch_all_sources(
+    source_defs: list[dict[str, Any]],
+    max_workers: int = 8,
+) -> list[tuple[list[dict[str, Any]], dict[str, Any]]]:
+    # HTTP sources go to the pool; everything else (local files) runs inline while they are in flight.
+    # Results keep the input order.
+    remote = [idx for idx, src in enumerate(source_defs) if src.get("kind") == "http_json"]
+    if not remote:
+        return [fetch_source(src) for src in source_defs]
+    results: list[tuple[list[dict[str, Any]], dict[str, Any]] | None] = [None] * len(source_defs)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(remote)))) as executor:
+        futures = {idx: executor.submit(fetch_source, source_defs[idx]) for idx in remote}
+        for idx, src in enumerate(source_defs):
+            if idx not in futures:
+                results[idx] = fetch_source(src)
+        for idx, future in futures.items():
+            results[idx] = future.result()
+    return [result for result in results if result is not None]
+
+
+FINGERPRINT_KEYS = (
+    "title",
+    "region",
+    "target_group",
+    "category",
+    "eligibility_text",
+    "benefit_text",
+    "application_period_text",
+    "official_url",
+)
+
+
+DETAIL_REQUIRED_FRAGMENTS = (
+    "공식 출처",
+    "최종 확인 시각",
+    "공식기관이 아니며",
+    "rel=\"canonical\"",
+)
+# Pages are scanned as raw UTF-8 bytes; no decode is needed for substring checks.
+_DETAIL_FRAGMENT_RE = re.compile(b"|".join(re.escape(frag.encode("utf-8")) for frag in DETAIL_REQUIRED_FRAGMENTS))
+_DISCLAIMER_BYTES = "공식기관이 아니며".encode("utf-8")
+BANNED_PHRASES = ("광고를 클릭", "지금 클릭해서 지원받기")
+_BANNED_PHRASES_BYTES = tuple((phrase, phrase.encode("utf-8")) for phrase in BANNED_PHRASES)
+
+
+def record_fingerprint(rec: dict[str, Any]) -> tuple[str, ...]:
+    # Compared as a plain tuple of field values: no hashing cost and no chance of a false "unchanged".
+    return tuple(str(rec.get(k, "")) for k in FINGERPRINT_KEYS)
+
+
 def normalize_records(
     source_rows: dict[str, list[dict[str, Any]]],
     source_defs: list[dict[str, Any]],
@@ -207,7 +463,8 @@ def normalize_records(
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     source_map = {s["source_id"]: s for s in source_defs}
     now = now_iso()
-    canonical: list[dict[str, Any]] = []
+    # Later rows with the same policy_id replace earlier ones but keep their position.
+    canonical_by_id: dict[str, dict[str, Any]] = {}
 
     def pick_row_value(
         row: dict[str, Any],
@@ -239,92 +496,71 @@ def normalize_records(
         for row in rows:
             policy_id = pick_row_value(row, mapping.get("id_field", "id"), "id")
             title = pick_row_value(row, mapping.get("title_field", "title"), "title")
-            if not policy_id:
-                seed_region = pick_row_value(row, mapping.get("region_field", "region"), "region")
-                seed = f"{source_id}:{title}:{seed_region}"
-                policy_id = hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
             if not title:
                 continue
-            canonical.append(
-                {
-                    "policy_id": policy_id,
-                    "title": title,
-                    "region": pick_row_value(
-                        row, mapping.get("region_field", "region"), "region", fallback="전국"
-                    ),
-                    "target_group": pick_row_value(
-                        row, mapping.get("target_field", "target_group"), "target_group", fallback="일반"
-                    ),
-                    "category": pick_row_value(
-                        row, mapping.get("category_field", "category"), "category", fallback="기타"
-                    ),
-                    "eligibility_text": pick_row_value(
-                        row,
-                        mapping.get("eligibility_field", "eligibility_text"),
-                        "eligibility_text",
-                        fallback="공고문 참고",
-                    ),
-                    "benefit_text": pick_row_value(
-                        row,
-                        mapping.get("benefit_field", "benefit_text"),
-                        "benefit_text",
-                        fallback="공고문 참고",
-                    ),
-                    "application_period_text": pick_row_value(
-                        row,
-                        mapping.get("application_period_field", "application_period_text"),
-                        "application_period_text",
-                        fallback="공고문 참고",
-                    ),
-                    "official_url": pick_row_value(
-                        row,
-                        mapping.get("official_url_field", "official_url"),
-                        "official_url",
-                        fallback=fallback_official_url,
-                    ),
-                    "source_org": pick_row_value(
-                        row, mapping.get("source_org_field", "source_org"), "source_org", fallback=source_id
-                    ),
-                    "source_api": source_id,
-                    "source_updated_at": pick_row_value(
-                        row,
-                        mapping.get("updated_field", "source_updated_at"),
-                        "source_updated_at",
-                        fallback=now,
-                    ),
-                    "last_checked_at": now,
-                    "status": "active",
-                }
-            )
-
-    deduped: dict[str, dict[str, Any]] = {}
-    for rec in canonical:
-        deduped[rec["policy_id"]] = rec
-    canonical = list(deduped.values())
+            region = pick_row_value(row, mapping.get("region_field", "region"), "region")
+            if not policy_id:
+                # SHA-1 stays: these ids feed slugs/URLs and must match earlier runs.
+                seed = f"{source_id}:{title}:{region}"
+                policy_id = hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
+            canonical_by_id[policy_id] = {
+                "policy_id": policy_id,
+                "title": title,
+                "region": region or "전국",
+                "target_group": pick_row_value(
+                    row, mapping.get("target_field", "target_group"), "target_group", fallback="일반"
+                ),
+                "category": pick_row_value(
+                    row, mapping.get("category_field", "category"), "category", fallback="기타"
+                ),
+                "eligibility_text": pick_row_value(
+                    row,
+                    mapping.get("eligibility_field", "eligibility_text"),
+                    "eligibility_text",
+                    fallback="공고문 참고",
+                ),
+                "benefit_text": pick_row_value(
+                    row,
+                    mapping.get("benefit_field", "benefit_text"),
+                    "benefit_text",
+                    fallback="공고문 참고",
+                ),
+                "application_period_text": pick_row_value(
+                    row,
+                    mapping.get("application_period_field", "application_period_text"),
+                    "application_period_text",
+                    fallback="공고문 참고",
+                ),
+                "official_url": pick_row_value(
+                    row,
+                    mapping.get("official_url_field", "official_url"),
+                    "official_url",
+                    fallback=fallback_official_url,
+                ),
+                "source_org": pick_row_value(
+                    row, mapping.get("source_org_field", "source_org"), "source_org", fallback=source_id
+                ),
+                "source_api": source_id,
+                "source_updated_at": pick_row_value(
+                    row,
+                    mapping.get("updated_field", "source_updated_at"),
+                    "source_updated_at",
+                    fallback=now,
+                ),
+                "last_checked_at": now,
+                "status": "active",
+            }
 
     previous_by_id = {p.get("policy_id"): p for p in previous_records if p.get("policy_id")}
-    current_by_id = {c["policy_id"]: c for c in canonical}
     changes: list[dict[str, Any]] = []
 
-    for pid, rec in current_by_id.items():
+    for pid, rec in canonical_by_id.items():
         old = previous_by_id.get(pid)
         if old is None:
             rec["change_type"] = "created"
             rec["change_summary"] = "신규 등록"
         else:
-            fingerprint_keys = [
-                "title",
-                "region",
-                "target_group",
-                "category",
-                "eligibility_text",
-                "benefit_text",
-                "application_period_text",
-                "official_url",
-            ]
-            before = "|".join(str(old.get(k, "")) for k in fingerprint_keys)
-            after = "|".join(str(rec.get(k, "")) for k in fingerprint_keys)
-            if before == after:
+            if record_fingerprint(old) == record_fingerprint(rec):
                 rec["change_type"] = "unchanged"
                 rec["change_summary"] = "변경 없음"
             else:
@@ -332,8 +568,9 @@ def normalize_records(
                 rec["change_summary"] = "핵심 정보 변경"
         changes.append({"policy_id": pid, "change_type": rec["change_type"], "title": rec["title"]})
 
+    canonical = list(canonical_by_id.values())
     for pid, old in previous_by_id.items():
-        if pid not in current_by_id:
+        if pid not in canonical_by_id:
             closed = dict(old)
             closed["status"] = "closed"
             closed["last_checked_at"] = now
@@ -346,56 +583,107 @@ def normalize_records(
 
 
 def compute_quality_metrics(canonical: list[dict[str, Any]], site_dir: Path | None = None) -> dict[str, Any]:
+    return profile_canonical(canonical, site_dir)[0]
+
+
+def stable_record(rec: dict[str, Any]) -> dict[str, Any]:
+    # Per-run check timestamps are left out so records that did not change compare equal across runs.
+    checked = rec.get("last_checked_at")
+    return {k: v for k, v in rec.items() if k != "last_checked_at" and not (k == "source_updated_at" and v == checked)}
+
+
+def scan_canonical(canonical: list[dict[str, Any]], schema_path: Path | None = None) -> dict[str, Any]:
+    """Record-level quality tallies and, given the policy schema, the canonical digest from one pass."""
     total = len(canonical) if canonical else 1
+    required_fields = tuple(REQUIRED_POLICY_FIELDS)
     null_count = 0
+    id_count = 0
+    ids_seen: set[str] = set()
+    bad_links = 0
+    links = 0
+    official_url_missing = 0
+    stable: list[dict[str, Any]] = []
+    # One pass over the records for null, duplicate-id and link tallies plus the digest rows.
     for rec in canonical:
-        for field in REQUIRED_POLICY_FIELDS:
-            value = rec.get(field)
-            if value is None or str(value).strip() == "":
+        get = rec.get
+        for field in required_fields:
+            value = get(field)
+            if value is None:
+                null_count += 1
+            elif isinstance(value, str):
+                if not value.strip():
+                    null_count += 1
+            elif not str(value).strip():
                 null_count += 1
-    null_ratio = null_count / (total * len(REQUIRED_POLICY_FIELDS))
 
-    ids = [str(r.get("policy_id", "")).strip() for r in canonical if r.get("policy_id")]
-    duplicate_ratio = 0.0
-    if ids:
-        duplicate_ratio = (len(ids) - len(set(ids))) / len(ids)
+        if get("policy_id"):
+            id_count += 1
+            ids_seen.add(str(get("policy_id", "")).strip())
 
-    bad_links = 0
-    links = 0
-    for rec in canonical:
-        url = str(rec.get("official_url", ""))
+        url = str(get("official_url", ""))
         if url:
             links += 1
-            if not (url.startswith("http://") or url.startswith("https://")):
+            if not url.startswith(("http://", "https://")):
                 bad_links += 1
-    broken_link_ratio = bad_links / (links or 1)
+        if not url.strip():
+            official_url_missing += 1
 
-    missing_sections = 0
-    if site_dir and site_dir.exists():
-        required_fragments = [
-            "공식 출처",
-            "최종 확인 시각",
-            "공식기관이 아니며",
-            "rel=\"canonical\"",
-        ]
-        for html_path in site_dir.rglob("index.html"):
-            rel_parts = html_path.relative_to(site_dir).parts
-            # detail page only: grants/{slug}/index.html
-            if len(rel_parts) != 3 or rel_parts[0] != "grants" or rel_parts[2] != "index.html":
-                continue
-            text = html_path.read_text(encoding="utf-8")
-            for frag in required_fragments:
-                if frag not in text:
-                    missing_sections += 1
-                    break
+        if schema_path is not None:
+            stable.append(stable_record(rec))
 
-    return {
+    null_ratio = null_count / (total * len(required_fields))
+    duplicate_ratio = 0.0
+    if id_count:
+        duplicate_ratio = (id_count - len(ids_seen)) / id_count
+    broken_link_ratio = bad_links / (links or 1)
+    stats: dict[str, Any] = {
         "null_ratio": round(null_ratio, 6),
         "duplicate_ratio": round(duplicate_ratio, 6),
         "broken_link_ratio": round(broken_link_ratio, 6),
-        "missing_sections_count": missing_sections,
         "total_policies": len(canonical),
+        "official_url_missing": official_url_missing,
+    }
+    if schema_path is not None:
+        if orjson is not None:
+            payload = orjson.dumps(stable, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        digest = hashlib.blake2b(schema_path.read_bytes(), digest_size=20)
+        digest.update(payload)
+        stats["digest"] = digest.hexdigest()
+    return stats
+
+
+def count_missing_sections(site_dir: Path | None) -> int:
+    missing_sections = 0
+    if site_dir and site_dir.exists():
+        # detail page only: grants/{slug}/index.html
+        for html_path in site_dir.glob("grants/*/index.html"):
+            data = html_path.read_bytes()
+            found: set[bytes] = set()
+            for match in _DETAIL_FRAGMENT_RE.finditer(data):
+                found.add(match.group())
+                if len(found) == len(DETAIL_REQUIRED_FRAGMENTS):
+                    break
+            if len(found) < len(DETAIL_REQUIRED_FRAGMENTS):
+                missing_sections += 1
+    return missing_sections
+
+
+def profile_canonical(
+    canonical: list[dict[str, Any]], site_dir: Path | None = None, stats: dict[str, Any] | None = None
+) -> tuple[dict[str, Any], int]:
+    """Quality metrics plus the official_url_missing count; pass scan_canonical stats to reuse its tallies."""
+    if stats is None:
+        stats = scan_canonical(canonical)
+    metrics = {
+        "null_ratio": stats["null_ratio"],
+        "duplicate_ratio": stats["duplicate_ratio"],
+        "broken_link_ratio": stats["broken_link_ratio"],
+        "missing_sections_count": count_missing_sections(site_dir),
+        "total_policies": stats["total_policies"],
     }
+    return metrics, stats["official_url_missing"]
 
 
 def evaluate_quality(
@@ -435,17 +723,16 @@ def evaluate_quality(
 def evaluate_monetization(site_dir: Path) -> dict[str, Any]:
     hard: list[str] = []
     soft: list[str] = []
-    banned_phrases = ["광고를 클릭", "지금 클릭해서 지원받기"]
     detail_pages = list(site_dir.glob("grants/*/index.html"))
 
     if not detail_pages:
         hard.append("no policy detail pages generated")
     for page in detail_pages:
-        text = page.read_text(encoding="utf-8")
-        if "공식기관이 아니며" not in text:
+        data = page.read_bytes()
+        if _DISCLAIMER_BYTES not in data:
             hard.append(f"disclaimer missing in {page}")
-        for phrase in banned_phrases:
-            if phrase in text:
+        for phrase, phrase_bytes in _BANNED_PHRASES_BYTES:
+            if phrase_bytes in data:
                 hard.append(f"banned phrase found in {page}: {phrase}")
 
     decision = "pass"
@@ -458,21 +745,53 @@ def evaluate_monetization(site_dir: Path) -> dict[str, Any]:
 
 
 def group_by(records: list[dict[str, Any]], key: str) -> dict[str, list[dict[str, Any]]]:
-    grouped: dict[str, list[dict[str, Any]]] = {}
+    grouped: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
     for rec in records:
-        value = str(rec.get(key, "기타")).strip() or "기타"
-        grouped.setdefault(value, []).append(rec)
+        value = rec.get(key, "기타")
+        if type(value) is not str:
+            value = str(value)
+        grouped[value.strip() or "기타"].append(rec)
+    return dict(grouped)
+
+
+def group_by_keys(records: list[dict[str, Any]], keys: Iterable[str]) -> dict[str, dict[str, list[dict[str, Any]]]]:
+    # Same buckets as calling group_by once per key, built in a single pass over records.
+    return {
+        key: {value: [records[idx] for idx in positions] for value, positions in bucket.items()}
+        for key, bucket in group_indices_by_keys(records, keys).items()
+    }
+
+
+def group_indices_by_keys(records: list[dict[str, Any]], keys: Iterable[str]) -> dict[str, dict[str, list[int]]]:
+    # group_by_keys buckets, holding positions in records instead of the records themselves.
+    keys = tuple(keys)
+    grouped: dict[str, dict[str, list[int]]] = {key: {} for key in keys}
+    buckets = [(key, grouped[key]) for key in keys]
+    for idx, rec in enumerate(records):
+        for key, bucket in buckets:
+            value = rec.get(key, "기타")
+            if type(value) is not str:
+                value = str(value)
+            value = value.strip() or "기타"
+            positions = bucket.get(value)
+            if positions is None:
+                bucket[value] = [idx]
+            else:
+                positions.append(idx)
     return grouped
 
 
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
 def html_escape(value: str) -> str:
-    return (
-        value.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#x27;")
-    )
+    return value.translate(_HTML_ESCAPE_TABLE)
+
+
+@functools.lru_cache(maxsize=4096)
+def escape_label(value: str) -> str:
+    # Region, target and category labels repeat across every page of a build.
+    return value.translate(_HTML_ESCAPE_TABLE)
 
 
 def to_multiline_html(value: str, fallback: str = "") -> str:
@@ -491,7 +810,7 @@ def extract_first_sentence(value: str, fallback: str = "공고문 참고") -> st
     first_line = normalized.split("\n")[0].strip()
     if not first_line:
         first_line = normalized.strip()
-    match = re.search(r"(.+?[.!?])(?:\s|$)", first_line)
+    match = _FIRST_SENT.search(first_line)
     if match:
         sentence = match.group(1).strip()
     else:
@@ -512,9 +831,9 @@ def format_benefit_detail_html(value: str, fallback: str = "공고문 참고") -
 
     cleaned_lines: list[str] = []
     for line in lines:
-        cleaned = re.sub(r"^[\-\*\u2022\u25CB\u25CF\s]+", "", line).strip()
-        cleaned = re.sub(r"^[0-9]+\)", "", cleaned).strip()
-        cleaned = re.sub(r"^[①-⑳]", "", cleaned).strip()
+        cleaned = _LIST_BULLET.sub("", line).strip()
+        cleaned = _LIST_NUM.sub("", cleaned).strip()
+        cleaned = _LIST_CIRCLED.sub("", cleaned).strip()
         cleaned_lines.append(cleaned or line)
     items = "".join(f"<li>{html_escape(item)}</li>" for item in cleaned_lines)
     return f'<ul class="benefit-list">{items}</ul>'
@@ -532,39 +851,29 @@ def format_period_text(value: str) -> str:
     if not raw:
         return "공고문 참고"
 
-    pattern = re.compile(r"(?<!\d)(\d{8})(?!\d)")
-
     def repl(match: re.Match[str]) -> str:
         return format_yyyymmdd(match.group(1))
 
-    converted = pattern.sub(repl, raw)
+    converted = _YYYYMMDD.sub(repl, raw)
     return converted
 
 
+_TARGET_SEP_TABLE = str.maketrans({"，": ",", "ㆍ": ",", "·": ",", "/": ",", "|": ","})
+
+
+def _split_dedup_targets(raw: str) -> list[str]:
+    parts = [part.strip() for part in raw.translate(_TARGET_SEP_TABLE).split(",")]
+    return list(dict.fromkeys(part for part in parts if part))
+
+
 def format_target_group_html(value: str) -> str:
     raw = str(value or "").strip()
     if not raw:
         return '<div class="target-pill-group"><span class="target-pill">일반</span></div>'
-    normalized = (
-        raw.replace("，", ",")
-        .replace("ㆍ", ",")
-        .replace("·", ",")
-        .replace("/", ",")
-        .replace("|", ",")
-    )
-    parts = [part.strip() for part in normalized.split(",") if part.strip()]
-    if not parts:
-        return html_escape(raw)
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for part in parts:
-        if part in seen:
-            continue
-        seen.add(part)
-        deduped.append(part)
+    deduped = _split_dedup_targets(raw)
     if not deduped:
-        deduped = ["일반"]
-    chips = "".join(f'<span class="target-pill">{html_escape(part)}</span>' for part in deduped)
+        return html_escape(raw)
+    chips = "".join([f'<span class="target-pill">{html_escape(part)}</span>' for part in deduped])
     return f'<div class="target-pill-group">{chips}</div>'
 
 
@@ -572,23 +881,9 @@ def format_target_group_compact(value: str, max_items: int = 3) -> str:
     raw = str(value or "").strip()
     if not raw:
         return "일반"
-    normalized = (
-        raw.replace("，", ",")
-        .replace("ㆍ", ",")
-        .replace("·", ",")
-        .replace("/", ",")
-        .replace("|", ",")
-    )
-    parts = [part.strip() for part in normalized.split(",") if part.strip()]
-    if not parts:
+    deduped = _split_dedup_targets(raw)
+    if not deduped:
         return raw
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for part in parts:
-        if part in seen:
-            continue
-        seen.add(part)
-        deduped.append(part)
     if len(deduped) <= max_items:
         label = ", ".join(deduped)
     else:
@@ -597,7 +892,12 @@ def format_target_group_compact(value: str, max_items: int = 3) -> str:
 
 
 def format_checked_at(value: str) -> str:
-    raw = str(value or "").strip()
+    return _format_checked_at_cached(str(value or "").strip())
+
+
+# Most records share one run timestamp, so parse each distinct string once.
+@functools.lru_cache(maxsize=1024)
+def _format_checked_at_cached(raw: str) -> str:
     if not raw:
         return "확인 시각 정보 없음"
     try:
@@ -609,7 +909,11 @@ def format_checked_at(value: str) -> str:
 
 
 def parse_iso_datetime(value: str) -> dt.datetime | None:
-    raw = str(value or "").strip()
+    return _parse_iso_cached(str(value or "").strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_cached(raw: str) -> dt.datetime | None:
     if not raw:
         return None
     normalized = raw.replace("Z", "+00:00")
@@ -620,83 +924,44 @@ def parse_iso_datetime(value: str) -> dt.datetime | None:
 
 
 def extract_period_end_date(value: str) -> dt.date | None:
-    raw = str(value or "").strip()
+    return _period_end_date_cached(str(value or "").strip())
+
+
+# Period texts repeat heavily across records (shared deadlines, "상시" variants).
+@functools.lru_cache(maxsize=4096)
+def _period_end_date_cached(raw: str) -> dt.date | None:
     if not raw:
         return None
     if "상시" in raw:
         return None
 
-    converted = format_period_text(raw)
-    matches = re.findall(r"(\d{4})[-./](\d{2})[-./](\d{2})", converted)
-    if matches:
-        y, m, d = matches[-1]
-        try:
-            return dt.date(int(y), int(m), int(d))
-        except ValueError:
-            return None
-
-    compact_matches = re.findall(r"(?<!\d)(\d{8})(?!\d)", raw)
-    if not compact_matches:
+    last = None
+    for last in _PERIOD_DATE.finditer(raw):
+        pass
+    if last is None:
         return None
-    digits = compact_matches[-1]
+    y, m, d, digits = last.groups()
+    if digits:
+        y, m, d = digits[:4], digits[4:6], digits[6:8]
     try:
-        return dt.date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+        return dt.date(int(y), int(m), int(d))
     except ValueError:
         return None
 
 
 def write_text(path: Path, text: str) -> None:
     ensure_dir(path.parent)
-    path.write_text(text, encoding="utf-8")
+    write_bytes(path, text.encode("utf-8"))
 
 
-def render_layout(
-    title: str,
-    description: str,
-    canonical_url: str,
-    body: str,
-    adsense_client_id: str = "",
-    ga_measurement_id: str = "",
-    social_image_url: str = "",
-) -> str:
-    adsense = ""
-    if adsense_client_id:
-        adsense = (
-            f'<script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client={html_escape(adsense_client_id)}" '
-            'crossorigin="anonymous"></script>'
-        )
-    analytics = ""
-    if ga_measurement_id:
-        escaped_measurement_id = html_escape(ga_measurement_id.strip())
-        analytics = f"""
-  <script async src="https://www.googletagmanager.com/gtag/js?id={escaped_measurement_id}"></script>
-  <script>
-    window.dataLayer = window.dataLayer || [];
-    function gtag() {{dataLayer.push(arguments);}}
-    gtag('js', new Date());
-    gtag('config', '{escaped_measurement_id}');
-  </script>"""
-    social_meta = ""
-    if social_image_url:
-        social_meta = f"""
-  <meta property="og:image" content="{html_escape(social_image_url)}" />
-  <meta name="twitter:card" content="summary_large_image" />
-  <meta name="twitter:image" content="{html_escape(social_image_url)}" />"""
-    return f"""<!doctype html>
+# Static layout shell; render_layout only joins the per-page pieces in between.
+_LAYOUT_HEAD = """<!doctype html>
 <html lang="ko">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{html_escape(title)}</title>
-  <meta name="description" content="{html_escape(description)}" />
-  <link rel="canonical" href="{html_escape(canonical_url)}" />
-  <link rel="stylesheet" href="/styles.css" />
-  <meta property="og:type" content="article" />
-  <meta property="og:title" content="{html_escape(title)}" />
-  <meta property="og:description" content="{html_escape(description)}" />
-  {social_meta}
-  {analytics}
-  {adsense}
+  <title>"""
+_LAYOUT_BODY_OPEN = """
 </head>
 <body>
   <header class="site-header">
@@ -710,7 +975,8 @@ def render_layout(
     <div class="reading-track"><div class="reading-bar"></div></div>
   </header>
   <main class="container">
-  {body}
+  """
+_LAYOUT_FOOTER = """
   </main>
   <footer class="site-footer" role="contentinfo">
     <nav class="footer-nav" aria-label="푸터 링크">
@@ -728,19 +994,69 @@ def render_layout(
 """
 
 
-def generate_site(
-    canonical: list[dict[str, Any]],
-    changes: list[dict[str, Any]],
-    site_dir: Path,
-    site_base_url: str,
+@functools.lru_cache(maxsize=8)
+def _layout_head_tail(adsense_client_id: str, ga_measurement_id: str) -> str:
+    # Tracking snippets and the body opener are identical for every page of a build.
+    adsense = ""
+    if adsense_client_id:
+        adsense = (
+            f'<script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client={html_escape(adsense_client_id)}" '
+            'crossorigin="anonymous"></script>'
+        )
+    analytics = ""
+    if ga_measurement_id:
+        escaped_measurement_id = html_escape(ga_measurement_id.strip())
+        analytics = f"""
+  <script async src="https://www.googletagmanager.com/gtag/js?id={escaped_measurement_id}"></script>
+  <script>
+    window.dataLayer = window.dataLayer || [];
+    function gtag() {{dataLayer.push(arguments);}}
+    gtag('js', new Date());
+    gtag('config', '{escaped_measurement_id}');
+  </script>"""
+    return "".join(("\n  ", analytics, "\n  ", adsense, _LAYOUT_BODY_OPEN))
+
+
+def render_layout(
+    title: str,
+    description: str,
+    canonical_url: str,
+    body: str,
     adsense_client_id: str = "",
     ga_measurement_id: str = "",
-) -> dict[str, Any]:
-    if site_dir.exists():
-        shutil.rmtree(site_dir)
-    ensure_dir(site_dir)
+    social_image_url: str = "",
+) -> str:
+    social_meta = ""
+    if social_image_url:
+        social_meta = f"""
+  <meta property="og:image" content="{html_escape(social_image_url)}" />
+  <meta name="twitter:card" content="summary_large_image" />
+  <meta name="twitter:image" content="{html_escape(social_image_url)}" />"""
+    escaped_title = html_escape(title)
+    escaped_description = html_escape(description)
+    return "".join(
+        (
+            _LAYOUT_HEAD,
+            escaped_title,
+            '</title>\n  <meta name="description" content="',
+            escaped_description,
+            '" />\n  <link rel="canonical" href="',
+            html_escape(canonical_url),
+            '" />\n  <link rel="stylesheet" href="/styles.css" />\n  <meta property="og:type" content="article" />'
+            '\n  <meta property="og:title" content="',
+            escaped_title,
+            '" />\n  <meta property="og:description" content="',
+            escaped_description,
+            '" />\n  ',
+            social_meta,
+            _layout_head_tail(adsense_client_id, ga_measurement_id),
+            body,
+            _LAYOUT_FOOTER,
+        )
+    )
 
-    styles = """
+
+SITE_STYLES = """
 @import url('https://fonts.googleapis.com/css2?family=Plus+Jakarta+Sans:wght@500;700;800&family=Noto+Sans+KR:wght@400;500;700&display=swap');
 
 :root {
@@ -1412,78 +1728,128 @@ a:hover { text-decoration: underline; }
   .footer-nav { gap: 8px 12px; }
 }
 """
-    write_text(site_dir / "styles.css", styles.strip() + "\n")
+_SITE_STYLES_BYTES = (SITE_STYLES.strip() + "\n").encode("utf-8")
 
-    active = [r for r in canonical if r.get("status") == "active"]
-    generated_pages = 0
-    excluded_pages = 0
-    sitemap_urls: list[str] = []
-    generated_thumbnails = 0
-    thumbnail_errors: list[dict[str, str]] = []
 
-    from generate_thumbnails import generate_thumbnails_for_policies
+TEMPLATE_VERSION = "v3"
 
-    thumbnail_base_image = Path(os.getenv("THUMBNAIL_BASE_IMAGE", "apps/site/assets/thumbnail/base.png"))
-    if not thumbnail_base_image.is_absolute():
-        thumbnail_base_image = ROOT / thumbnail_base_image
 
-    thumbnail_output_dir = site_dir / "assets" / "thumbnails"
-    thumbnail_result = generate_thumbnails_for_policies(
-        policies=active,
-        base_image_path=thumbnail_base_image,
-        output_dir=thumbnail_output_dir,
-        site_base_url=site_base_url,
-        font_paths=[
-            ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansCJKkr-Bold.otf",
-            ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansCJKkr-Regular.otf",
-            ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansKR-Bold.ttf",
-            ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansKR-Regular.ttf",
-        ],
-    )
-    thumbnail_items = thumbnail_result["items"]
-    generated_thumbnails = int(thumbnail_result["generated"])
-    thumbnail_errors = thumbnail_result["errors"]
-    thumbnail_map = {str(item.get("slug", "")): item for item in thumbnail_items}
+def build_hash(*parts: Any) -> str:
+    payload = json.dumps([TEMPLATE_VERSION, *parts], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
-    home_cards: list[dict[str, Any]] = []
-    for rec in active:
-        slug = slugify(rec["policy_id"])
-        page_path = site_dir / "grants" / slug / "index.html"
-        canonical_url = f"{site_base_url.rstrip('/')}/grants/{slug}/"
-        description = f"{rec['target_group']} 대상 {rec['category']} 정책. 신청기간, 조건, 방법, 서류를 한 번에 확인."
-        thumbnail = thumbnail_map.get(slug)
-        social_image_url = str(thumbnail.get("public_url", "")) if thumbnail else ""
-        thumbnail_link = str(rec.get("official_url", "")).strip() or "#official"
-        thumbnail_figure = f"""
+
+def build_cache_path(site_dir: Path) -> Path:
+    # Kept under artifacts/ so it is never published with the site; one file per output directory.
+    key = hashlib.blake2b(str(site_dir.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+    return ROOT / "artifacts" / "build_cache" / f"site-{key}.json"
+
+
+def load_build_cache(path: Path) -> dict[str, str]:
+    if not path.exists():
+        return {}
+    try:
+        data = read_json(path)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def prune_stale_outputs(roots: list[Path], keep: set[Path]) -> None:
+    for root in roots:
+        if not root.exists():
+            continue
+        for path in sorted(root.rglob("*"), reverse=True):
+            if path.is_dir():
+                if not any(path.iterdir()):
+                    path.rmdir()
+            elif path not in keep:
+                path.unlink()
+
+
+_POLICY_PAGE_FIELDS = itemgetter(
+    "policy_id",
+    "title",
+    "region",
+    "target_group",
+    "category",
+    "benefit_text",
+    "eligibility_text",
+    "application_period_text",
+    "official_url",
+    "last_checked_at",
+)
+
+
+def checked_at_section(last_checked_at: Any) -> str:
+    # Kept separate so a cached detail page can have just this line refreshed.
+    return f'<section class="article-section"><h2>최종 확인 시각</h2><p>{format_checked_at(last_checked_at)}</p></section>'
+
+
+def render_policy_page(
+    rec: dict[str, Any],
+    site_dir: Path,
+    site_base_url: str,
+    thumbnail_map: dict[str, dict[str, Any]],
+    adsense_client_id: str = "",
+    ga_measurement_id: str = "",
+) -> tuple[str, dict[str, Any]]:
+    """Render and write one policy detail page into its existing directory; returns its canonical URL and home card."""
+    (
+        policy_id,
+        title,
+        region,
+        target_group,
+        category,
+        benefit_text,
+        eligibility_text,
+        period_text,
+        official_url,
+        last_checked_at,
+    ) = _POLICY_PAGE_FIELDS(rec)
+    slug = slugify(policy_id)
+    page_path = site_dir / "grants" / slug / "index.html"
+    canonical_url = f"{site_base_url.rstrip('/')}/grants/{slug}/"
+    description = f"{target_group} 대상 {category} 정책. 신청기간, 조건, 방법, 서류를 한 번에 확인."
+    thumbnail = thumbnail_map.get(slug)
+    social_image_url = str(thumbnail.get("public_url", "")) if thumbnail else ""
+    thumbnail_link = str(official_url).strip() or "#official"
+    # Escape each field once; the body reuses them several times.
+    title_html = html_escape(title)
+    region_html = escape_label(region)
+    target_html = escape_label(target_group)
+    category_html = escape_label(category)
+    official_html = html_escape(official_url)
+    thumbnail_figure = f"""
   <figure class="hero-block" aria-label="정책 썸네일">
     <a href="{html_escape(thumbnail_link)}" target="_blank" rel="noopener noreferrer">
-      <img class="thumb-image" src="{html_escape(str(thumbnail['relative_path']))}" alt="{html_escape(rec['title'])} 정책 썸네일" loading="lazy" />
+      <img class="thumb-image" src="{html_escape(str(thumbnail['relative_path']))}" alt="{title_html} 정책 썸네일" loading="lazy" />
     </a>
   </figure>
 """
-        if thumbnail is None:
-            thumbnail_figure = f"""
+    if thumbnail is None:
+        thumbnail_figure = f"""
   <figure class="hero-block" aria-label="정책 썸네일 형태">
     <a href="{html_escape(thumbnail_link)}" target="_blank" rel="noopener noreferrer">
       <div class="thumb-slot" role="img" aria-label="정책 썸네일 미리보기">
         <div class="thumb-guide">
           <p class="thumb-label">대표 썸네일</p>
-          <p class="thumb-title">{html_escape(rec['title'])}</p>
-          <p class="thumb-meta">{html_escape(rec['region'])} · {html_escape(rec['target_group'])} · {html_escape(rec['category'])}</p>
+          <p class="thumb-title">{title_html}</p>
+          <p class="thumb-meta">{region_html} · {target_html} · {category_html}</p>
         </div>
       </div>
     </a>
   </figure>
 """
-        body = f"""
+    body = f"""
 <article class="policy-post">
   <header class="post-header">
-    <p class="kicker">{html_escape(rec['category'])}</p>
-    <h1 class="policy-title">{html_escape(rec['title'])}</h1>
-    <p class="meta-line">{html_escape(rec['region'])} · {html_escape(rec['target_group'])}</p>
+    <p class="kicker">{category_html}</p>
+    <h1 class="policy-title">{title_html}</h1>
+    <p class="meta-line">{region_html} · {target_html}</p>
   </header>
   {thumbnail_figure}
-  <section class="policy-summary"><h2>핵심 요약</h2><p class="preline">{to_multiline_html(rec['benefit_text'], fallback='공고문 참고')}</p></section>
+  <section class="policy-summary"><h2>핵심 요약</h2><p class="preline">{to_multiline_html(benefit_text, fallback='공고문 참고')}</p></section>
   <nav class="toc-nav" aria-label="정책 정보 목차">
     <ul class="toc-list">
       <li><a href="#eligibility">지원 대상</a></li>
@@ -1497,20 +1863,20 @@ a:hover { text-decoration: underline; }
   <section id="eligibility" class="article-section eligibility-focus">
     <h2>지원 대상</h2>
     <p class="target-lead">해당되는 대상 유형을 먼저 확인하세요.</p>
-    {format_target_group_html(rec.get('target_group', '일반'))}
-    <p class="preline eligibility-detail">{to_multiline_html(rec['eligibility_text'], fallback='공고문 참고')}</p>
+    {format_target_group_html(target_group)}
+    <p class="preline eligibility-detail">{to_multiline_html(eligibility_text, fallback='공고문 참고')}</p>
   </section>
   <section id="benefit" class="article-section benefit-focus">
     <h2>지원 내용</h2>
     <p class="benefit-lead">이 사업에서 제공하는 핵심 지원입니다.</p>
-    <p class="benefit-keyline">{html_escape(extract_first_sentence(rec['benefit_text'], fallback='공고문 참고'))}</p>
-    <div class="benefit-detail">{format_benefit_detail_html(rec['benefit_text'], fallback='공고문 참고')}</div>
+    <p class="benefit-keyline">{html_escape(extract_first_sentence(benefit_text, fallback='공고문 참고'))}</p>
+    <div class="benefit-detail">{format_benefit_detail_html(benefit_text, fallback='공고문 참고')}</div>
   </section>
-  <section id="period" class="article-section"><h2>신청 기간</h2><p>{html_escape(format_period_text(rec['application_period_text']))}</p></section>
+  <section id="period" class="article-section"><h2>신청 기간</h2><p>{html_escape(format_period_text(period_text))}</p></section>
   <section id="method" class="article-section"><h2>신청 방법</h2><p>자세한 신청 방법은 공식 출처에서 확인하세요.</p></section>
   <section id="docs" class="article-section"><h2>제출 서류</h2><p>공고문 기준으로 준비하세요.</p></section>
-  <section id="official" class="article-section"><h2>공식 출처</h2><p><a href="{html_escape(rec['official_url'])}" rel="noopener noreferrer" target="_blank">{html_escape(rec['official_url'])}</a></p></section>
-  <section class="article-section"><h2>최종 확인 시각</h2><p>{format_checked_at(rec['last_checked_at'])}</p></section>
+  <section id="official" class="article-section"><h2>공식 출처</h2><p><a href="{official_html}" rel="noopener noreferrer" target="_blank">{official_html}</a></p></section>
+  {checked_at_section(last_checked_at)}
   <section class="notice-section"><h2>안내</h2><p>본 사이트는 공식기관이 아니며, 최종 신청 및 자격 판단은 반드시 원문 공고를 확인하세요.</p></section>
   <section class="recommend-section">
     <h2>함께 보면 좋은 페이지</h2>
@@ -1521,41 +1887,219 @@ a:hover { text-decoration: underline; }
   </section>
 </article>
 """
-        html = render_layout(
-            rec["title"],
-            description,
-            canonical_url,
-            body,
-            adsense_client_id,
-            ga_measurement_id,
-            social_image_url=social_image_url,
+    html = render_layout(
+        title,
+        description,
+        canonical_url,
+        body,
+        adsense_client_id,
+        ga_measurement_id,
+        social_image_url=social_image_url,
+    )
+    write_bytes(page_path, html.encode("utf-8"))
+    return canonical_url, policy_home_card(rec, slug)
+
+
+def policy_home_card(rec: dict[str, Any], slug: str) -> dict[str, Any]:
+    return {
+        "slug": slug,
+        "title": str(rec.get("title", "")),
+        "region": str(rec.get("region", "전국")),
+        "target_group": str(rec.get("target_group", "일반")),
+        "category": str(rec.get("category", "기타")),
+        "period_text": format_period_text(str(rec.get("application_period_text", ""))),
+        "checked_at": parse_iso_datetime(str(rec.get("last_checked_at", ""))),
+        "period_end_date": extract_period_end_date(str(rec.get("application_period_text", ""))),
+    }
+
+
+_HOME_CARD_TEMPLATE = """<li class="policy-card-item">
+  <a class="policy-card" href="/grants/{slug}/">
+    <p class="policy-card-kicker">{region} · {category}</p>
+    <h3>{title}</h3>
+    <p class="policy-card-target">{target_group}</p>
+    <p class="policy-card-period">신청기간: {period_text}</p>
+    {badge}
+  </a>
+</li>"""
+
+
+def render_home_card(card: dict[str, Any], today: dt.date) -> str:
+    badge = ""
+    end_date = card.get("period_end_date")
+    if isinstance(end_date, dt.date):
+        remaining = (end_date - today).days
+        if remaining == 0:
+            badge = '<span class="policy-card-badge">오늘 마감</span>'
+        elif remaining == 1:
+            badge = '<span class="policy-card-badge">내일 마감</span>'
+        elif remaining > 1:
+            badge = f'<span class="policy-card-badge">{remaining}일 남음</span>'
+    return _HOME_CARD_TEMPLATE.format_map(
+        {
+            "slug": html_escape(str(card.get("slug", "")).strip()),
+            "region": escape_label(str(card.get("region", "전국")).strip() or "전국"),
+            "category": escape_label(str(card.get("category", "기타")).strip() or "기타"),
+            "title": html_escape(str(card.get("title", "")).strip()),
+            "target_group": escape_label(format_target_group_compact(str(card.get("target_group", "일반")))),
+            "period_text": html_escape(str(card.get("period_text", "공고문 참고")).strip() or "공고문 참고"),
+            "badge": badge,
+        }
+    )
+
+
+def generate_site(
+    canonical: Iterable[dict[str, Any]],
+    changes: list[dict[str, Any]],
+    site_dir: Path,
+    site_base_url: str,
+    adsense_client_id: str = "",
+    ga_measurement_id: str = "",
+    full_rebuild: bool = False,
+) -> dict[str, Any]:
+    ensure_dir(site_dir)
+    cache_path = build_cache_path(site_dir)
+    # full_rebuild ignores the previous cache (e.g. after renderer changes that did not bump TEMPLATE_VERSION).
+    build_cache = {} if full_rebuild else load_build_cache(cache_path)
+    next_cache: dict[str, str] = {}
+    # Everything generate_site writes goes in here; anything else under site_dir is stale and pruned at the end.
+    keep_paths: set[Path] = {site_dir / "styles.css"}
+
+    write_bytes_if_changed(site_dir / "styles.css", _SITE_STYLES_BYTES)
+
+    active = [r for r in canonical if r.get("status") == "active"]
+    slugs = [slugify(r["policy_id"]) for r in active]
+    slug_by_pid = {r["policy_id"]: slug for r, slug in zip(active, slugs)}
+    generated_pages = 0
+    excluded_pages = 0
+    sitemap_urls: set[str] = set()
+    generated_thumbnails = 0
+    thumbnail_errors: list[dict[str, str]] = []
+
+    from generate_thumbnails import generate_thumbnails_for_policies, render_key, thumbnail_item
+
+    thumbnail_base_image = Path(os.getenv("THUMBNAIL_BASE_IMAGE", "apps/site/assets/thumbnail/base.png"))
+    if not thumbnail_base_image.is_absolute():
+        thumbnail_base_image = ROOT / thumbnail_base_image
+    font_paths = [
+        ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansCJKkr-Bold.otf",
+        ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansCJKkr-Regular.otf",
+        ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansKR-Bold.ttf",
+        ROOT / "apps" / "site" / "assets" / "fonts" / "NotoSansKR-Regular.ttf",
+    ]
+    page_salt = [site_base_url, adsense_client_id, ga_measurement_id]
+    thumb_salt = [
+        [str(path), path.stat().st_mtime_ns, path.stat().st_size]
+        for path in [thumbnail_base_image, *font_paths]
+        if path.exists()
+    ]
+
+    # Thumbnails only depend on what render_thumbnail draws, so they are cached separately
+    # from the page and survive edits to the rest of the record.
+    thumbnail_output_dir = site_dir / "assets" / "thumbnails"
+    thumb_reuse: list[bool] = []
+    for rec, slug in zip(active, slugs):
+        thumb_path = thumbnail_output_dir / f"{slug}.jpg"
+        key = f"assets/thumbnails/{thumb_path.name}"
+        next_cache[key] = build_hash(thumb_salt, render_key(rec))
+        thumb_reuse.append(build_cache.get(key) == next_cache[key] and thumb_path.exists())
+        keep_paths.add(thumb_path)
+
+    thumbnail_result = generate_thumbnails_for_policies(
+        policies=[rec for rec, reuse in zip(active, thumb_reuse) if not reuse],
+        base_image_path=thumbnail_base_image,
+        output_dir=thumbnail_output_dir,
+        site_base_url=site_base_url,
+        font_paths=font_paths,
+    )
+    thumbnail_errors = thumbnail_result["errors"]
+    rendered_thumbnails = {str(item.get("slug", "")): item for item in thumbnail_result["items"]}
+    # Keep the item order of a full build: reused thumbnails rebuild their entry from the record.
+    thumbnail_items: list[dict[str, str]] = []
+    for rec, slug, reuse in zip(active, slugs, thumb_reuse):
+        if reuse:
+            thumbnail_items.append(thumbnail_item(str(rec["policy_id"]).strip(), slug, rec, site_base_url))
+        elif slug in rendered_thumbnails:
+            thumbnail_items.append(rendered_thumbnails[slug])
+    # Only thumbnails rendered in this run count as generated; cache hits are reported separately.
+    generated_thumbnails = len(rendered_thumbnails)
+    reused_thumbnails = len(thumbnail_items) - generated_thumbnails
+    thumbnail_map = {str(item.get("slug", "")): item for item in thumbnail_items}
+
+    reuse_flags: list[bool] = []
+    for rec, slug in zip(active, slugs):
+        page_path = site_dir / "grants" / slug / "index.html"
+        key = f"grants/{slug}"
+        # The thumbnail item is part of the key, so a page first written without one is redone once it exists.
+        # last_checked_at is not: it changes every run and only the checked-at line shows it, which is patched on reuse.
+        next_cache[key] = build_hash(page_salt, stable_record(rec), thumbnail_map.get(slug))
+        next_cache[f"{key}:checked"] = str(rec.get("last_checked_at", ""))
+        reuse = (
+            build_cache.get(key) == next_cache[key]
+            and f"{key}:checked" in build_cache
+            and page_path.exists()
         )
-        write_text(page_path, html)
+        if not reuse:
+            os.makedirs(page_path.parent, exist_ok=True)
+        reuse_flags.append(reuse)
+        keep_paths.add(page_path)
+
+    def build_policy_page(rec: dict[str, Any], slug: str, reuse: bool) -> tuple[str, dict[str, Any]]:
+        if reuse:
+            page_path = site_dir / "grants" / slug / "index.html"
+            old_section = checked_at_section(build_cache[f"grants/{slug}:checked"])
+            new_section = checked_at_section(rec.get("last_checked_at", ""))
+            if old_section == new_section:
+                return f"{site_base_url.rstrip('/')}/grants/{slug}/", policy_home_card(rec, slug)
+            text = page_path.read_text(encoding="utf-8")
+            if old_section in text:
+                write_text(page_path, text.replace(old_section, new_section, 1))
+                return f"{site_base_url.rstrip('/')}/grants/{slug}/", policy_home_card(rec, slug)
+        return render_policy_page(rec, site_dir, site_base_url, thumbnail_map, adsense_client_id, ga_measurement_id)
+
+    home_cards: list[dict[str, Any]] = []
+    # Detail pages are independent; render and write them on a thread pool, collect in order.
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        page_results = list(executor.map(build_policy_page, active, slugs, reuse_flags))
+    for canonical_url, card in page_results:
         generated_pages += 1
-        sitemap_urls.append(canonical_url)
-        home_cards.append(
-            {
-                "slug": slug,
-                "title": str(rec.get("title", "")),
-                "region": str(rec.get("region", "전국")),
-                "target_group": str(rec.get("target_group", "일반")),
-                "category": str(rec.get("category", "기타")),
-                "period_text": format_period_text(str(rec.get("application_period_text", ""))),
-                "checked_at": parse_iso_datetime(str(rec.get("last_checked_at", ""))),
-                "period_end_date": extract_period_end_date(str(rec.get("application_period_text", ""))),
-            }
-        )
+        sitemap_urls.add(canonical_url)
+        home_cards.append(card)
+    reused_pages = sum(reuse_flags)
+
+    # Remaining pages are rendered here and handed to an IO pool for encoding and writing.
+    io_pool = ThreadPoolExecutor(max_workers=8)
+    pending_writes: list[Future[None]] = []
+
+    def submit_write(path: Path, text: str) -> None:
+        pending_writes.append(io_pool.submit(write_text, path, text))
+
+    def flush_writes() -> None:
+        for future in pending_writes:
+            future.result()
+        pending_writes.clear()
 
     # Hubs
     route_label_map = {"region": "지역", "target": "대상", "category": "분야"}
-    for key, route in [("region", "region"), ("target_group", "target"), ("category", "category")]:
-        grouped = group_by(active, key)
-        for group_value, rows in grouped.items():
+    hub_routes = [("region", "region"), ("target_group", "target"), ("category", "category")]
+    hub_groups = group_by_keys(active, [key for key, _ in hub_routes])
+    for key, route in hub_routes:
+        for group_value, rows in hub_groups[key].items():
             slug = slugify(group_value)
             page_path = site_dir / "grants" / route / slug / "index.html"
             canonical_url = f"{site_base_url.rstrip('/')}/grants/{route}/{slug}/"
+            keep_paths.add(page_path)
+            generated_pages += 1
+            sitemap_urls.add(canonical_url)
+            cache_key = f"grants/{route}/{slug}"
+            next_cache[cache_key] = build_hash(
+                page_salt, route, group_value, [[r["policy_id"], r["title"]] for r in rows]
+            )
+            if build_cache.get(cache_key) == next_cache[cache_key] and page_path.exists():
+                reused_pages += 1
+                continue
             items = "\n".join(
-                f'<li class="link-item"><a href="/grants/{slugify(r["policy_id"])}/">{html_escape(r["title"])}</a></li>'
+                f'<li class="link-item"><a href="/grants/{slug_by_pid[r["policy_id"]]}/">{html_escape(r["title"])}</a></li>'
                 for r in rows
             )
             body = f"""
@@ -1576,13 +2120,17 @@ a:hover { text-decoration: underline; }
                 adsense_client_id,
                 ga_measurement_id,
             )
-            write_text(page_path, html)
-            generated_pages += 1
-            sitemap_urls.append(canonical_url)
+            submit_write(page_path, html)
+
+    flush_writes()
 
     # Updates page
+    def change_slug(change: dict[str, Any]) -> str:
+        policy_id = str(change.get("policy_id", ""))
+        return slug_by_pid.get(policy_id) or slugify(policy_id or "unknown")
+
     update_items = "\n".join(
-        f'<li class="link-item"><a href="/grants/{slugify(str(c.get("policy_id", "")) or "unknown")}/">{html_escape(c["title"])} · {html_escape(c["change_type"])}</a></li>'
+        f'<li class="link-item"><a href="/grants/{change_slug(c)}/">{html_escape(c["title"])} · {html_escape(c["change_type"])}</a></li>'
         for c in changes[:100]
     )
     update_content = '<p class="empty-state">표시할 변경사항이 아직 없습니다.</p>'
@@ -1599,12 +2147,13 @@ a:hover { text-decoration: underline; }
 </article>
 """
     updates_url = f"{site_base_url.rstrip('/')}/updates/"
-    write_text(
+    keep_paths.add(site_dir / "updates" / "index.html")
+    submit_write(
         site_dir / "updates" / "index.html",
         render_layout("최근 변경사항", "정책 변경 내역", updates_url, updates_body, adsense_client_id, ga_measurement_id),
     )
     generated_pages += 1
-    sitemap_urls.append(updates_url)
+    sitemap_urls.add(updates_url)
 
     # Policy pages
     policy_pages = [
@@ -1680,8 +2229,17 @@ a:hover { text-decoration: underline; }
     for page in policy_pages:
         route = page["route"]
         page_url = f"{site_base_url.rstrip('/')}/{route}/"
-        write_text(
-            site_dir / route / "index.html",
+        page_path = site_dir / route / "index.html"
+        keep_paths.add(page_path)
+        generated_pages += 1
+        sitemap_urls.add(page_url)
+        # Static pages only change with the template and build settings.
+        next_cache[route] = build_hash(page_salt, page)
+        if build_cache.get(route) == next_cache[route] and page_path.exists():
+            reused_pages += 1
+            continue
+        submit_write(
+            page_path,
             render_layout(
                 str(page["title"]),
                 str(page["description"]),
@@ -1691,8 +2249,6 @@ a:hover { text-decoration: underline; }
                 ga_measurement_id,
             ),
         )
-        generated_pages += 1
-        sitemap_urls.append(page_url)
 
     # Home
     today = dt.date.today()
@@ -1706,50 +2262,28 @@ a:hover { text-decoration: underline; }
                 return 0.0
         return 0.0
 
-    recent_cards = sorted(home_cards, key=checked_rank, reverse=True)
+    # Rank each card once; both sorts then read plain floats.
+    for card in home_cards:
+        card["checked_rank"] = checked_rank(card)
+    recent_cards = sorted(home_cards, key=itemgetter("checked_rank"), reverse=True)
     deadline_cards = [
         card
         for card in home_cards
         if isinstance(card.get("period_end_date"), dt.date)
         and 0 <= (card["period_end_date"] - today).days <= 14
     ]
-    deadline_cards.sort(key=lambda card: (card["period_end_date"], -checked_rank(card)))
+    deadline_cards.sort(key=lambda card: (card["period_end_date"], -card["checked_rank"]))
     deadline_slugs = {str(card.get("slug", "")) for card in deadline_cards}
     fresh_cards = [card for card in recent_cards if str(card.get("slug", "")) not in deadline_slugs]
 
     def render_home_card_list(rows: list[dict[str, Any]], empty_text: str) -> str:
         if not rows:
             return f'<p class="empty-state">{html_escape(empty_text)}</p>'
-        chunks: list[str] = []
+        # Cards recur across sections, so each one is rendered once and kept on the card.
         for card in rows:
-            slug = str(card.get("slug", "")).strip()
-            title = str(card.get("title", "")).strip()
-            region = str(card.get("region", "전국")).strip() or "전국"
-            category = str(card.get("category", "기타")).strip() or "기타"
-            target_group = format_target_group_compact(str(card.get("target_group", "일반")))
-            period_text = str(card.get("period_text", "공고문 참고")).strip() or "공고문 참고"
-            badge = ""
-            end_date = card.get("period_end_date")
-            if isinstance(end_date, dt.date):
-                remaining = (end_date - today).days
-                if remaining == 0:
-                    badge = '<span class="policy-card-badge">오늘 마감</span>'
-                elif remaining == 1:
-                    badge = '<span class="policy-card-badge">내일 마감</span>'
-                elif remaining > 1:
-                    badge = f'<span class="policy-card-badge">{remaining}일 남음</span>'
-            chunks.append(
-                f"""<li class="policy-card-item">
-  <a class="policy-card" href="/grants/{html_escape(slug)}/">
-    <p class="policy-card-kicker">{html_escape(region)} · {html_escape(category)}</p>
-    <h3>{html_escape(title)}</h3>
-    <p class="policy-card-target">{html_escape(target_group)}</p>
-    <p class="policy-card-period">신청기간: {html_escape(period_text)}</p>
-    {badge}
-  </a>
-</li>"""
-            )
-        return f'<ul class="home-grid">{"".join(chunks)}</ul>'
+            if "html" not in card:
+                card["html"] = render_home_card(card, today)
+        return f'<ul class="home-grid">{"".join(card["html"] for card in rows)}</ul>'
 
     deadline_content = render_home_card_list(deadline_cards[:12], "마감 임박 정책이 아직 없습니다.")
     fresh_content = render_home_card_list(fresh_cards[:12], "최근 업데이트된 정책이 아직 없습니다.")
@@ -1795,55 +2329,79 @@ a:hover { text-decoration: underline; }
 </article>
 """
     home_url = f"{site_base_url.rstrip('/')}/"
-    write_text(
+    keep_paths.update([site_dir / "index.html", site_dir / "robots.txt", site_dir / "sitemap.xml"])
+    submit_write(
         site_dir / "index.html",
         render_layout("지원알람", "정책/보조금 정보를 매일 갱신", home_url, home_body, adsense_client_id, ga_measurement_id),
     )
     generated_pages += 1
-    sitemap_urls.append(home_url)
+    sitemap_urls.add(home_url)
 
     # robots + sitemap
     robots = "User-agent: *\nAllow: /\nSitemap: /sitemap.xml\n"
-    write_text(site_dir / "robots.txt", robots)
-    sitemap_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-    ]
-    for u in sorted(set(sitemap_urls)):
-        sitemap_lines.append(f"  <url><loc>{html_escape(u)}</loc><lastmod>{now_iso()}</lastmod></url>")
-    sitemap_lines.append("</urlset>")
-    write_text(site_dir / "sitemap.xml", "\n".join(sitemap_lines) + "\n")
+    submit_write(site_dir / "robots.txt", robots)
+    # Every URL is the base URL plus a slug path, and slugs carry no HTML metacharacters,
+    # so only the base needs escaping.
+    base_url = site_base_url.rstrip("/")
+    base_html = html_escape(base_url)
+    lastmod = now_iso()
+    sorted_urls = sorted(sitemap_urls)
+    sitemap_parts = [b'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n']
+    sitemap_parts.extend(
+        f"  <url><loc>{base_html}{u[len(base_url):]}</loc><lastmod>{lastmod}</lastmod></url>\n".encode("utf-8")
+        for u in sorted_urls
+    )
+    sitemap_parts.append(b"</urlset>\n")
+    pending_writes.append(io_pool.submit(write_bytes, site_dir / "sitemap.xml", b"".join(sitemap_parts)))
+    flush_writes()
+    io_pool.shutdown()
+    prune_stale_outputs([site_dir], keep_paths)
+    write_json(cache_path, next_cache)
 
     return {
         "generated_pages": generated_pages,
+        "reused_pages": reused_pages,
         "excluded_pages": excluded_pages,
-        "sitemap_entries": len(set(sitemap_urls)),
-        "sitemap_urls": sorted(set(sitemap_urls)),
+        "sitemap_entries": len(sorted_urls),
+        "sitemap_urls": sorted_urls,
         "generated_thumbnails": generated_thumbnails,
+        "reused_thumbnails": reused_thumbnails,
         "thumbnail_errors": thumbnail_errors,
         "thumbnails": thumbnail_items,
     }
 
 
-def run_http_health_checks(site_base_url: str, top_urls: list[str]) -> list[str]:
-    errors: list[str] = []
-    for rel in top_urls:
-        url = f"{site_base_url.rstrip('/')}{rel}"
-        try:
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                if resp.status >= 400:
-                    errors.append(f"{url} => {resp.status}")
-        except Exception as exc:  # noqa: BLE001
-            errors.append(f"{url} => {exc}")
-    return errors
+def check_url(url: str) -> str | None:
+    try:
+        if _HTTP is not None:
+            # Same keep-alive pool as the source fetches, so the probes share connections.
+            resp = _HTTP.request("GET", url, timeout=urllib3.Timeout(total=20))
+            if resp.status >= 400:
+                return f"{url} => {resp.status}"
+            return None
+        req = urllib.request.Request(url, method="GET")
+        with urllib.request.urlopen(req, timeout=20) as resp:
+            if resp.status >= 400:
+                return f"{url} => {resp.status}"
+    except Exception as exc:  # noqa: BLE001
+        return f"{url} => {exc}"
+    return None
+
+
+def run_http_health_checks(site_base_url: str, top_urls: list[str], max_workers: int = 16) -> list[str]:
+    if not top_urls:
+        return []
+    urls = [f"{site_base_url.rstrip('/')}{rel}" for rel in top_urls]
+    # Probes are independent; total wall time is bounded by the slowest URL, not the sum.
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return [error for error in executor.map(check_url, urls) if error is not None]
 
 
 def load_previous_latest() -> list[dict[str, Any]]:
     latest_path = ROOT / "data" / "canonical" / "latest" / "policies.json"
     if not latest_path.exists():
         return []
-    data = read_json(latest_path)
+    data = read_json_large(latest_path)
     return data if isinstance(data, list) else []
 
 
@@ -1855,8 +2413,13 @@ def save_canonical_with_rotation(canonical: list[dict[str, Any]]) -> None:
     ensure_dir(latest_dir)
     ensure_dir(prev_dir)
     if latest_path.exists():
-        shutil.copy2(latest_path, prev_path)
-    write_json(latest_path, canonical)
+        # write_json replaces latest atomically, so a hardlink keeps the old snapshot intact.
+        prev_path.unlink(missing_ok=True)
+        try:
+            os.link(latest_path, prev_path)
+        except OSError:
+            shutil.copy2(latest_path, prev_path)
+    write_json(latest_path, canonical, durable=True)
 
 
 def write_run_meta(path: Path, run_id: str, status: str, stage: str, details: dict[str, Any]) -> None:
@@ -31,10 +31,11 @@ def main() -> int:
     args = parse_args()
 
     required = list(PROFILES[args.profile])
-    missing = [name for name in required if not os.getenv(name)]
+    env = os.environ
+    missing = [name for name in required if not env.get(name)]
 
     # Optional warning
-    adsense = os.getenv("ADSENSE_CLIENT_ID")
+    adsense = env.get("ADSENSE_CLIENT_ID")
     if not adsense and not args.allow_missing_adsense:
         print("[WARN] ADSENSE_CLIENT_ID is not set (optional)")
 
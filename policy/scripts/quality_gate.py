@@ -5,7 +5,7 @@ import argparse
 from pathlib import Path
 
 from runtime_guard import enforce_venv
-from pipeline_lib import ROOT, compute_quality_metrics, evaluate_quality, read_json, validate_schema
+from pipeline_lib import ROOT, evaluate_quality, profile_canonical, read_json_large, validate_schema
 
 
 def parse_args() -> argparse.Namespace:
@@ -30,19 +30,18 @@ def main() -> int:
         print(f"[ERROR] site dir not found: {site_dir}")
         return 1
 
-    canonical = read_json(canonical_path)
+    canonical = read_json_large(canonical_path)
     if not isinstance(canonical, list):
         print("[ERROR] canonical must be list")
         return 1
 
     previous_count = 0
     if previous_path and previous_path.exists():
-        prev = read_json(previous_path)
+        prev = read_json_large(previous_path)
         if isinstance(prev, list):
             previous_count = len(prev)
 
-    metrics = compute_quality_metrics(canonical, site_dir=site_dir)
-    official_url_missing = sum(1 for r in canonical if not str(r.get("official_url", "")).strip())
+    metrics, official_url_missing = profile_canonical(canonical, site_dir=site_dir)
     report = evaluate_quality(metrics, previous_count, len(canonical), official_url_missing)
 
     schema_errors = validate_schema(report, ROOT / "schemas" / "quality.v1.schema.json")
@@ -5,31 +5,39 @@ import argparse
 import datetime as dt
 import os
 import shutil
+import stat
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from runtime_guard import enforce_venv
 from pipeline_lib import (
     ROOT,
     build_manifest,
-    compute_quality_metrics,
     ensure_dir,
     evaluate_monetization,
     evaluate_quality,
-    fetch_source,
+    fetch_all_sources,
+    group_indices_by_keys,
     load_previous_latest,
     normalize_records,
     now_iso,
+    profile_canonical,
     read_json,
+    read_json_cached,
     read_json_subset_yaml,
     run_http_health_checks,
     save_canonical_with_rotation,
+    scan_canonical,
     validate_schema,
     write_json,
     write_run_meta,
     generate_site,
 )
 
+# Raw snapshot writes overlap with normalization and are joined before validation.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run full daily policy pipeline")
@@ -45,6 +53,7 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("SITE_BASE_URL", "https://pol.cbbxs.com"),
         help="Public base URL used for canonical and sitemap",
     )
+    parser.add_argument("--full-rebuild", action="store_true", help="Ignore the site build cache and render every page")
     return parser.parse_args()
 
 
@@ -69,11 +78,74 @@ def copy_run_artifacts(
     write_json(run_dir / "fetch" / "report.json", fetch_report)
 
 
+def previous_canonical_digest() -> str:
+    # Only runs that got past policy validation record a digest.
+    meta_path = ROOT / "artifacts" / "latest" / "run_meta.json"
+    if not meta_path.exists():
+        return ""
+    try:
+        details = read_json(meta_path).get("details", {})
+    except (OSError, ValueError):
+        return ""
+    return str(details.get("canonical_digest", "")) if isinstance(details, dict) else ""
+
+
+def mirror_tree(src: Path, dst: Path) -> None:
+    # Every file is hardlinked from src (copied if linking fails); entries src no longer has are removed.
+    ensure_dir(dst)
+    names: set[str] = set()
+    with os.scandir(src) as entries:
+        for entry in entries:
+            names.add(entry.name)
+            target = dst / entry.name
+            try:
+                current = os.lstat(target)
+            except FileNotFoundError:
+                current = None
+            if entry.is_dir(follow_symlinks=False):
+                if current is not None and not stat.S_ISDIR(current.st_mode):
+                    target.unlink()
+                mirror_tree(Path(entry.path), target)
+                continue
+            if current is not None:
+                if stat.S_ISDIR(current.st_mode):
+                    shutil.rmtree(target)
+                else:
+                    target.unlink()
+            try:
+                os.link(entry.path, target)
+            except OSError:
+                shutil.copy2(entry.path, target)
+    with os.scandir(dst) as entries:
+        for entry in entries:
+            if entry.name not in names:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+
+
 def sync_latest_run(run_dir: Path) -> None:
     latest = ROOT / "artifacts" / "latest"
-    if latest.exists():
-        shutil.rmtree(latest)
-    shutil.copytree(run_dir, latest)
+    if os.name != "nt":
+        # Point latest at the run instead of copying it; the rename swaps the link atomically.
+        tmp = latest.with_name("latest.new")
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+        try:
+            tmp.symlink_to(os.path.relpath(run_dir, latest.parent), target_is_directory=True)
+        except OSError:
+            pass
+        else:
+            if latest.is_dir() and not latest.is_symlink():
+                shutil.rmtree(latest)
+            os.replace(tmp, latest)
+            return
+
+    # No symlinks here: keep latest a real directory, but only touch files that changed.
+    if latest.is_symlink():
+        latest.unlink()
+    mirror_tree(run_dir, latest)
 
 
 def main() -> int:
@@ -95,18 +167,17 @@ def main() -> int:
         if source_schema_errors:
             raise RuntimeError(f"source schema invalid: {source_schema_errors}")
 
-        content_plan = read_json(ROOT / "data" / "content" / "cluster_defaults.json")
+        content_plan = read_json_cached(ROOT / "data" / "content" / "cluster_defaults.json")
         write_json(run_dir / "content" / "plan.json", content_plan)
 
         source_rows: dict[str, list[dict]] = {}
         fetch_report: list[dict] = []
+        raw_writes: list[Future[None]] = []
         primary_total = 0
         primary_success = 0
 
-        for src in source_config.get("sources", []):
-            if not src.get("enabled", False):
-                continue
-            rows, report = fetch_source(src)
+        enabled_sources = [src for src in source_config.get("sources", []) if src.get("enabled", False)]
+        for src, (rows, report) in zip(enabled_sources, fetch_all_sources(enabled_sources)):
             source_rows[src["source_id"]] = rows
             fetch_report.append(report)
             if src.get("primary", False):
@@ -116,20 +187,33 @@ def main() -> int:
 
             # raw snapshot by date
             raw_path = ROOT / "data" / "raw" / today / f"{src['source_id']}.json"
-            write_json(raw_path, rows)
-            write_json(run_dir / "raw" / f"{src['source_id']}.json", rows)
+            raw_writes.append(_IO_POOL.submit(write_json, raw_path, rows))
+            raw_writes.append(_IO_POOL.submit(write_json, run_dir / "raw" / f"{src['source_id']}.json", rows))
 
         if primary_total > 0 and primary_success == 0 and mode != "bootstrap":
             raise RuntimeError("all primary sources failed (hard fail)")
 
         previous = load_previous_latest()
         canonical, changes = normalize_records(source_rows, source_config.get("sources", []), previous)
+        for future in raw_writes:
+            future.result()
+
         if not canonical:
             raise RuntimeError("canonical dataset is empty")
 
-        policy_schema_errors = validate_schema(canonical, ROOT / "schemas" / "policy.v1.schema.json")
-        if policy_schema_errors:
-            raise RuntimeError(f"policy schema invalid: {policy_schema_errors[:5]}")
+        # Positions into canonical per source and per hub cluster, for consumers that filter instead of re-grouping.
+        indices = group_indices_by_keys(canonical, ("source_api", "region", "target_group", "category"))
+        write_json(run_dir / "indices" / "by_source.json", indices.pop("source_api"))
+        write_json(run_dir / "indices" / "by_cluster.json", indices)
+
+        policy_schema_path = ROOT / "schemas" / "policy.v1.schema.json"
+        canonical_stats = scan_canonical(canonical, policy_schema_path)
+        digest = canonical_stats["digest"]
+        # Same records and schema as the last validated run need no re-validation.
+        if digest != previous_canonical_digest():
+            policy_schema_errors = validate_schema(canonical, policy_schema_path)
+            if policy_schema_errors:
+                raise RuntimeError(f"policy schema invalid: {policy_schema_errors[:5]}")
 
         save_canonical_with_rotation(canonical)
 
@@ -143,13 +227,14 @@ def main() -> int:
             args.site_base_url,
             adsense_client_id,
             ga_measurement_id,
+            full_rebuild=args.full_rebuild,
         )
         thumbnail_errors = site_result.get("thumbnail_errors", [])
         frontend_soft_fail: list[str] = []
         if thumbnail_errors:
             frontend_soft_fail.append("thumbnail generation partial failure")
 
-        frontend_metrics = compute_quality_metrics(canonical, site_dir=site_dir)
+        frontend_metrics, official_url_missing = profile_canonical(canonical, site_dir=site_dir, stats=canonical_stats)
         frontend_hard_fail = [] if frontend_metrics.get("missing_sections_count", 0) == 0 else ["required frontend sections missing"]
         frontend_decision = "pass"
         if frontend_hard_fail:
@@ -162,10 +247,10 @@ def main() -> int:
             "soft_fail": frontend_soft_fail,
             "metrics": frontend_metrics,
             "generated_thumbnails": int(site_result.get("generated_thumbnails", 0)),
+            "reused_thumbnails": int(site_result.get("reused_thumbnails", 0)),
             "thumbnail_errors": thumbnail_errors,
         }
 
-        official_url_missing = sum(1 for r in canonical if not str(r.get("official_url", "")).strip())
         quality_report = evaluate_quality(
             metrics=frontend_metrics,
             previous_count=len(previous),
@@ -185,6 +270,7 @@ def main() -> int:
             sitemap_entries=site_result["sitemap_entries"],
         )
         manifest["generated_thumbnails"] = int(site_result.get("generated_thumbnails", 0))
+        manifest["reused_thumbnails"] = int(site_result.get("reused_thumbnails", 0))
         manifest_schema_errors = validate_schema(manifest, ROOT / "schemas" / "manifest.v1.schema.json")
         if manifest_schema_errors:
             raise RuntimeError(f"manifest schema invalid: {manifest_schema_errors[:5]}")
@@ -225,6 +311,7 @@ def main() -> int:
                     "quality": quality_report["decision"],
                     "monetization": monetization_report["decision"],
                     "generated_pages": site_result["generated_pages"],
+                    "canonical_digest": digest,
                 },
             )
             sync_latest_run(run_dir)
@@ -240,6 +327,7 @@ def main() -> int:
                 "quality": quality_report["decision"],
                 "monetization": monetization_report["decision"],
                 "generated_pages": site_result["generated_pages"],
+                "canonical_digest": digest,
             },
         )
         sync_latest_run(run_dir)
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import os
 import sys
 from pathlib import Path
 
 
+@functools.cache
 def is_venv_python() -> bool:
+    # The interpreter cannot change mid-process, so the answer is computed once.
     if getattr(sys, "base_prefix", sys.prefix) != sys.prefix:
         return True
     if getattr(sys, "real_prefix", None):
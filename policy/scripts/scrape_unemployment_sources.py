@@ -8,8 +8,16 @@ import datetime as dt
 import html
 import json
 import re
-import subprocess
+import shutil
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.error import HTTPError
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
 
 SOURCES: list[dict[str, str]] = [
     {
@@ -116,38 +124,38 @@ NEWLINE_TAGS = [
     "article",
 ]
 
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_WS = re.compile(r"\s+")
+_INLINE_WS = re.compile(r"[ \t]+")
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_HTML_MARKUP = re.compile(
+    r"<(?P<skip>script|style|noscript|svg|canvas|iframe)[^>]*>.*?</(?P=skip)>"
+    rf"|(?P<newline></?(?:{'|'.join(NEWLINE_TAGS)})\b[^>]*>)"
+    r"|<[^>]+>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _replace_markup(match: re.Match[str]) -> str:
+    return "\n" if match.group("newline") else " "
+
 
 def extract_title(page_html: str) -> str:
-    match = re.search(r"<title[^>]*>(.*?)</title>", page_html, flags=re.IGNORECASE | re.DOTALL)
+    match = _TITLE.search(page_html)
     if not match:
         return ""
     title = html.unescape(match.group(1))
-    return re.sub(r"\s+", " ", title).strip()
+    return _WS.sub(" ", title).strip()
 
 
 def clean_html_text(page_html: str) -> str:
-    text = re.sub(r"<!--.*?-->", " ", page_html, flags=re.DOTALL)
-    text = re.sub(
-        r"<(script|style|noscript|svg|canvas|iframe)[^>]*>.*?</\1>",
-        " ",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    for tag in NEWLINE_TAGS:
-        text = re.sub(rf"</?{tag}\b[^>]*>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = _HTML_COMMENT.sub(" ", page_html)
+    text = _HTML_MARKUP.sub(_replace_markup, text)
     text = html.unescape(text)
     text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    cleaned_lines: list[str] = []
-    for line in text.split("\n"):
-        compact = re.sub(r"[ \t]+", " ", line).strip()
-        if compact:
-            cleaned_lines.append(compact)
-
-    text = "\n".join(cleaned_lines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    text = _INLINE_WS.sub(" ", text)
+    return "\n".join(line for line in map(str.strip, text.split("\n")) if line)
 
 
 def normalize_md_text(text: str) -> str:
@@ -172,8 +180,7 @@ def apply_scope(page_html: str, source: dict[str, str]) -> tuple[str, bool]:
     return page_html[start_idx:end_idx], True
 
 
-def read_html_file(raw_path: Path) -> str:
-    payload = raw_path.read_bytes()
+def decode_html(payload: bytes) -> str:
     for encoding in ("utf-8", "cp949", "euc-kr"):
         try:
             return payload.decode(encoding)
@@ -182,48 +189,53 @@ def read_html_file(raw_path: Path) -> str:
     return payload.decode("utf-8", errors="replace")
 
 
-def fetch_with_curl(url: str, raw_path: Path, header_path: Path) -> tuple[int, str]:
-    cmd = [
-        "curl",
-        "-L",
-        "-sS",
-        "-D",
-        str(header_path),
-        "-o",
-        str(raw_path),
-        "-w",
-        "%{http_code}|%{content_type}",
-        url,
-    ]
-    result = subprocess.run(cmd, check=False, capture_output=True, text=True)
-    if result.returncode != 0:
-        message = (result.stderr or result.stdout or "curl failed").strip()
-        raise RuntimeError(message)
-
-    status_code = 0
-    content_type = ""
-    status_and_type = (result.stdout or "").strip().split("|", maxsplit=1)
-    if status_and_type and status_and_type[0].isdigit():
-        status_code = int(status_and_type[0])
-    if len(status_and_type) > 1:
-        content_type = status_and_type[1].strip()
-
-    header_text = header_path.read_text(encoding="utf-8", errors="replace")
-    for line in header_text.splitlines():
-        if line.lower().startswith("content-type:"):
-            content_type = line.split(":", maxsplit=1)[1].strip()
-    return status_code, content_type
-
-
-def scrape(output_dir: Path, max_chars: int) -> tuple[list[dict[str, str]], list[str]]:
+def read_html_file(raw_path: Path) -> str:
+    return decode_html(raw_path.read_bytes())
+
+
+def is_pdf_response(url: str, content_type: str) -> bool:
+    return "pdf" in content_type.lower() or url.lower().endswith(".pdf")
+
+
+def fetch_url(url: str, pdf_path: Path) -> tuple[int, str, bytes | None]:
+    # PDFs are streamed straight to pdf_path (body None); other responses are returned in memory.
+    req = urllib.request.Request(url, method="GET", headers={"User-Agent": "Mozilla/5.0"})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            content_type = resp.headers.get("Content-Type", "")
+            if is_pdf_response(url, content_type):
+                with pdf_path.open("wb") as f:
+                    shutil.copyfileobj(resp, f, 64 * 1024)
+                return resp.status, content_type, None
+            return resp.status, content_type, resp.read()
+    except HTTPError as exc:
+        with exc:
+            return exc.code, exc.headers.get("Content-Type", ""), exc.read()
+
+
+def fetch_all(
+    sources: list[dict[str, str]], raw_dir: Path, workers: int = 6
+) -> list[tuple[int, str, bytes | None] | Exception]:
+    def fetch_one(source: dict[str, str]) -> tuple[int, str, bytes | None] | Exception:
+        try:
+            return fetch_url(source["url"], raw_dir / f"{source['id']}.pdf")
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(sources)))) as pool:
+        return list(pool.map(fetch_one, sources))
+
+
+def scrape(output_dir: Path, max_chars: int, now_iso: str) -> tuple[list[dict[str, str]], list[str]]:
     raw_dir = output_dir / "raw"
     raw_dir.mkdir(parents=True, exist_ok=True)
 
     records: list[dict[str, str]] = []
     md_sections: list[str] = []
-    now_iso = dt.datetime.now(dt.timezone.utc).isoformat()
 
-    for i, source in enumerate(SOURCES, start=1):
+    fetched = fetch_all(SOURCES, raw_dir)
+
+    for i, (source, result) in enumerate(zip(SOURCES, fetched), start=1):
         record: dict[str, str] = {
             "id": source["id"],
             "name": source["name"],
@@ -231,22 +243,21 @@ def scrape(output_dir: Path, max_chars: int) -> tuple[list[dict[str, str]], list
             "fetched_at_utc": now_iso,
         }
         try:
-            tmp_raw_path = raw_dir / f"{source['id']}.raw"
-            header_path = raw_dir / f"{source['id']}.headers.txt"
-            status_code, content_type = fetch_with_curl(source["url"], tmp_raw_path, header_path)
+            if isinstance(result, Exception):
+                raise result
+            status_code, content_type, body = result
 
             record["status_code"] = str(status_code)
             record["content_type"] = content_type
 
-            is_pdf = "pdf" in content_type.lower() or source["url"].lower().endswith(".pdf")
+            is_pdf = is_pdf_response(source["url"], content_type)
             extension = "pdf" if is_pdf else "html"
             raw_path = raw_dir / f"{source['id']}.{extension}"
-            tmp_raw_path.replace(raw_path)
-            if header_path.exists():
-                header_path.unlink()
+            if body is not None:
+                raw_path.write_bytes(body)
 
             record["raw_file"] = str(raw_path)
-            record["raw_bytes"] = str(raw_path.stat().st_size)
+            record["raw_bytes"] = str(raw_path.stat().st_size if body is None else len(body))
 
             section_lines = [
                 f"## {i}. {source['name']}",
@@ -261,7 +272,7 @@ def scrape(output_dir: Path, max_chars: int) -> tuple[list[dict[str, str]], list
                 section_lines.append("- 추출 상태: PDF 원본만 저장 (텍스트 추출 미적용)")
             else:
                 should_extract_text = source.get("extract_text", "true").lower() != "false"
-                raw_html = read_html_file(raw_path)
+                raw_html = decode_html(body)
                 title = extract_title(raw_html)
                 record["title"] = title
 
@@ -336,34 +347,38 @@ def main() -> None:
     output_dir = build_output_dir(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    records, sections = scrape(output_dir=output_dir, max_chars=args.max_chars_per_page)
+    # One timestamp for the fetch records, the Markdown header and index.json.
+    now_iso = dt.datetime.now(dt.timezone.utc).isoformat()
+    records, sections = scrape(output_dir=output_dir, max_chars=args.max_chars_per_page, now_iso=now_iso)
 
     md_path = output_dir / "sources.md"
     md_header = [
         "# 실업급여 관련 공식 자료 스크래핑",
         "",
-        f"- 생성일시(UTC): {dt.datetime.now(dt.timezone.utc).isoformat()}",
+        f"- 생성일시(UTC): {now_iso}",
         f"- 대상 URL 수: {len(SOURCES)}",
         "- 비고: 본 문서는 원문 텍스트 자동 추출본이며, 법적 판단 전 원문 확인 필요",
         "",
     ]
-    md_path.write_text("\n\n".join(md_header + sections) + "\n", encoding="utf-8")
+    with md_path.open("w", encoding="utf-8") as f:
+        f.write("\n\n".join(md_header))
+        for section in sections:
+            f.write("\n\n")
+            f.write(section)
+        f.write("\n")
 
     index_path = output_dir / "index.json"
-    index_path.write_text(
-        json.dumps(
-            {
-                "generated_at_utc": dt.datetime.now(dt.timezone.utc).isoformat(),
-                "output_dir": str(output_dir),
-                "count": len(records),
-                "sources": records,
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    index = {
+        "generated_at_utc": now_iso,
+        "output_dir": str(output_dir),
+        "count": len(records),
+        "sources": records,
+    }
+    if orjson is not None:
+        payload = orjson.dumps(index, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        payload = (json.dumps(index, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    index_path.write_bytes(payload)
 
     print(f"Saved: {md_path}")
     print(f"Saved: {index_path}")